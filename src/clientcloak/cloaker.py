@@ -13,12 +13,14 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
 from .comments import process_comments
-from .detector import _SUFFIX_PATTERN
+from .detector import _TRAILING_SUFFIX_RE
 from .docx_handler import (
-    extract_all_text,
+    compile_replacements,
+    iter_all_text,
     load_document,
     replace_text_in_document,
     replace_text_in_xml,
@@ -65,9 +67,12 @@ def _build_mappings_and_replacements(
         and config.party_b_name
         and config.party_a_label == config.party_b_label
     ):
+        used_labels = {config.party_a_label}
         party_b_label = "Counterparty"
-        if party_b_label == config.party_a_label:
-            party_b_label = f"{config.party_b_label}-2"
+        suffix = 2
+        while party_b_label in used_labels:
+            party_b_label = f"{config.party_b_label}-{suffix}"
+            suffix += 1
         logger.warning(
             "Party label collision: both parties labelled '%s'. "
             "Renaming party B to '%s'.",
@@ -123,12 +128,7 @@ def _strip_corporate_suffix(name: str) -> str:
 
     Handles both "Name LLC" and "Name, LLC" (comma-separated) forms.
     """
-    return re.sub(
-        rf",?\s+(?:{_SUFFIX_PATTERN})\s*$",
-        "",
-        name,
-        flags=re.IGNORECASE,
-    ).strip()
+    return _TRAILING_SUFFIX_RE.sub("", name).strip()
 
 
 def _make_short_placeholder(
@@ -224,10 +224,90 @@ def _expand_content_replacements(
     return expanded
 
 
-_PERSON_MONTH_STOPWORDS = frozenset({"May", "March", "August", "June", "April"})
+# Name parts that double as calendar words.  A person called "June Smith"
+# must not turn every "June 1" date into a placeholder.
+_PERSON_STOPWORDS: frozenset[str] = frozenset({
+    "January", "February", "March", "April", "May", "June", "July",
+    "August", "September", "October", "November", "December",
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday",
+    "Sunday",
+})
 
 _PERSON_PLACEHOLDER_RE = re.compile(r"^\[Person-\d+\]$")
 
+# A single-letter initial such as "L" or "L.".
+_INITIAL_RE = re.compile(r"[A-Z]\.?")
+
+
+_WORD_BOUNDARY_RE = re.compile(r"\b")
+
+
+def _find_whole_word_phrases(phrases: list[str], document_text: str) -> set[str]:
+    """Return the *phrases* that occur in *document_text* as whole words.
+
+    All phrases are folded into one longest-first alternation wrapped in a
+    lookahead, so the text is scanned once and, at every position, the
+    longest phrase starting there is reported without consuming it --
+    "Woods" inside "Darren Woods" is still seen at its own position.
+    Shorter phrases that start at the same position as a reported one
+    (e.g. "Darren" for "Darren Woods") are recovered by checking the word
+    boundary inside the reported match.  Matching is case-sensitive.
+    """
+    ordered = sorted(set(phrases), key=len, reverse=True)
+    if not ordered:
+        return set()
+    pattern = re.compile(
+        r"(?=\b(" + "|".join(re.escape(p) for p in ordered) + r")\b)"
+    )
+    matched = {m.group(1) for m in pattern.finditer(document_text)}
+
+    found = set(matched)
+    for longer in matched:
+        for phrase in ordered:
+            if (
+                len(phrase) < len(longer)
+                and longer.startswith(phrase)
+                and _WORD_BOUNDARY_RE.match(longer, len(phrase))
+            ):
+                found.add(phrase)
+    return found
+
+
+def _find_name_variants(candidates: list[str], document_text: str) -> set[str]:
+    """Return the *candidates* that occur in *document_text* as whole words.
+
+    Each candidate matches either as written or in ALL-CAPS.
+    """
+    forms: dict[str, list[str]] = {}
+    for candidate in candidates:
+        forms.setdefault(candidate, []).append(candidate)
+        forms.setdefault(candidate.upper(), []).append(candidate)
+    return {
+        candidate
+        for form in _find_whole_word_phrases(list(forms), document_text)
+        for candidate in forms[form]
+    }
+
+
+def _iter_name_candidates(significant: list[str]) -> Iterator[str]:
+    """Yield the shorter variants of a name made of *significant* tokens.
+
+    Every contiguous run of 1..N-1 tokens is yielded, followed by the
+    first+last pair ("Darren Woods" for "Darren Lee Woods") unless it was
+    already produced as a run.
+    """
+    n = len(significant)
+    seen: set[str] = set()
+    for length in range(1, n):
+        for start in range(n - length + 1):
+            candidate = " ".join(significant[start:start + length])
+            seen.add(candidate)
+            yield candidate
+
+    first_last = f"{significant[0]} {significant[-1]}"
+    if first_last not in seen:
+        yield first_last
+
 
 def _expand_person_name_parts(
     cloak_replacements: dict[str, str],
@@ -244,48 +324,48 @@ def _expand_person_name_parts(
     """
     new_entries: dict[str, str] = {}
 
-    for original, placeholder in cloak_replacements.items():
-        if not _PERSON_PLACEHOLDER_RE.match(placeholder):
-            continue
-
+    person_entries = [
+        (original, placeholder)
+        for original, placeholder in cloak_replacements.items()
+        if _PERSON_PLACEHOLDER_RE.match(placeholder)
+    ]
+    if not person_entries:
+        # Nothing to expand: skip uppercasing and scanning the text.
+        return dict(cloak_replacements)
+    doc_upper = document_text.upper()
+
+    for original, placeholder in person_entries:
         # Step 1: tokenize into significant words, stripping single-letter
         # initials (e.g. "L." or "L").
         tokens = original.split()
         significant = [
             t for t in tokens
-            if not re.match(r"^[A-Z]\.?$", t)
+            if not _INITIAL_RE.fullmatch(t)
         ]
         if len(significant) < 2:
             continue
 
-        # Step 2: generate all contiguous subsequences of length 1..N-1
-        n = len(significant)
-        candidates: list[str] = []
-        for length in range(1, n):
-            for start in range(n - length + 1):
-                candidates.append(" ".join(significant[start:start + length]))
-
-        # Step 3: first+last shortcut (if not already generated)
-        first_last = f"{significant[0]} {significant[-1]}"
-        if first_last not in candidates:
-            candidates.append(first_last)
+        # Steps 2-3: lazily generate the shorter variants, and filter each
+        # one.  A substring test against the uppercased text (which catches
+        # both Title case and ALL-CAPS occurrences) drops variants that
+        # cannot possibly match before any regex work is done.
+        candidates = [
+            candidate for candidate in _iter_name_candidates(significant)
+            if len(candidate) >= 3
+            and candidate not in _PERSON_STOPWORDS
+            and candidate not in cloak_replacements
+            and candidate not in new_entries
+            and candidate.upper() in doc_upper
+        ]
+        if not candidates:
+            continue
 
-        # Step 4: filter each candidate
+        # Step 4: case-sensitive word-boundary check (Title case or ALL-CAPS)
+        # for every candidate in a single scan of the document.
+        present = _find_name_variants(candidates, document_text)
         for candidate in candidates:
-            if len(candidate) < 3:
-                continue
-            if candidate in _PERSON_MONTH_STOPWORDS:
-                continue
-            if candidate in cloak_replacements or candidate in new_entries:
-                continue
-
-            # Case-sensitive word-boundary check: Title case or ALL-CAPS
-            title_pattern = r"\b" + re.escape(candidate) + r"\b"
-            upper_pattern = r"\b" + re.escape(candidate.upper()) + r"\b"
-            if re.search(title_pattern, document_text) or re.search(
-                upper_pattern, document_text
-            ):
-                new_entries[candidate] = placeholder
+            if candidate in present:
+                new_entries.setdefault(candidate, placeholder)
 
     result = dict(cloak_replacements)
     result.update(new_entries)
@@ -367,15 +447,19 @@ def _split_multiline_replacements(
     key into individual non-empty lines, each mapping to the same placeholder.
     The original multi-line key is removed.
     """
-    expanded = {}
+    # Common case: nothing to split, so a C-level copy beats the loop below.
+    if not any("\n" in original for original in cloak_replacements):
+        return dict(cloak_replacements)
+
+    expanded: dict[str, str] = {}
     for original, placeholder in cloak_replacements.items():
-        if "\n" in original:
-            for line in original.split("\n"):
-                line = line.strip()
-                if line and line not in expanded:
-                    expanded[line] = placeholder
-        else:
+        if "\n" not in original:
             expanded[original] = placeholder
+            continue
+        for line in original.split("\n"):
+            line = line.strip()
+            if line:
+                expanded.setdefault(line, placeholder)
     return expanded
 
 
@@ -483,8 +567,7 @@ def cloak_document(
         logger.info("Security scan found %d issue(s).", len(findings))
 
     # --- 2b. Extract document text early (needed for name-variant expansion) ---
-    text_fragments = extract_all_text(doc)
-    full_text = "\n".join(t for t, _src in text_fragments)
+    full_text = "\n".join(t for t, _src in iter_all_text(doc))
 
     # --- 3. Build replacement dict (original -> placeholder) ---
     # Uses the shared helper so the logic is defined in one place.
@@ -530,7 +613,9 @@ def cloak_document(
             existing_placeholders.add(new_placeholder)
 
     # --- 4. Apply replacements ---
-    replacement_count = replace_text_in_document(doc, cloak_replacements)
+    # Both passes below use the same targets: build the matcher once.
+    compiled = compile_replacements(cloak_replacements)
+    replacement_count = replace_text_in_document(doc, cloak_replacements, compiled=compiled)
     logger.info("Applied %d text replacement(s).", replacement_count)
 
     # --- 5. Save document, then optionally strip metadata ---
@@ -539,7 +624,7 @@ def cloak_document(
     # --- 5b. Replace text in tracked changes (XML-level) ---
     # python-docx doesn't expose runs inside <w:ins>/<w:del> elements.
     # This catches originals in tracked changes, text boxes, footnotes.
-    xml_count = replace_text_in_xml(output_path, cloak_replacements)
+    xml_count = replace_text_in_xml(output_path, cloak_replacements, compiled=compiled)
     if xml_count:
         replacement_count += xml_count
         logger.info("Applied %d XML-level replacement(s) (tracked changes, etc.).", xml_count)
@@ -619,8 +704,7 @@ def preview_entities(
     from .detector import detect_entities
 
     doc = load_document(input_path)
-    text_fragments = extract_all_text(doc)
-    full_text = "\n".join(text for text, _source in text_fragments)
+    full_text = "\n".join(text for text, _source in iter_all_text(doc))
 
     # Collect all party names (primary + aliases) for filtering
     party_names: list[str] = [n for n in (config.party_a_name, config.party_b_name) if n]
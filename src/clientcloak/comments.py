@@ -29,13 +29,15 @@ the output path, so input == output is safe.
 
 import re
 import zipfile
+from collections.abc import Iterator
 from io import BytesIO
 from pathlib import Path
 from xml.etree import ElementTree as ET
 from xml.sax.saxutils import escape as xml_escape, unescape as xml_unescape
 
-from defusedxml.ElementTree import fromstring as _safe_fromstring
+from defusedxml.ElementTree import iterparse as _safe_iterparse
 
+from .literal_search import compile_literals
 from .models import CommentAuthor, CommentInfo, CommentMode
 
 
@@ -72,6 +74,24 @@ _ATTR_AUTHOR = f"{{{_NS_W}}}author"
 _ATTR_INITIALS = f"{{{_NS_W}}}initials"
 _ATTR_DATE = f"{{{_NS_W}}}date"
 
+# Deflate level for the parts a rewrite actually changes.  They are small,
+# highly compressible XML, where level 1 gets almost all of the default
+# level's ratio at a fraction of the cost.  writestr() with a ZipInfo
+# ignores the archive-wide level, so it is passed per entry as well.
+_REWRITE_COMPRESSLEVEL = 1
+
+# Raw-XML patterns.  Rewrites are done with regex on the serialized XML
+# (see _strip_all_comments) and run once per comment or text node, so the
+# patterns are compiled here rather than looked up in re's cache each time.
+_COMMENT_OPEN_TAG_RE = re.compile(r"<w:comment\s[^>]*?>")
+_COMMENT_ELEMENT_RE = re.compile(r"<w:comment\s[^>]*>[\s\S]*?</w:comment>")
+_COMMENT_MARKER_RE = re.compile(
+    r"<w:comment(?:RangeStart|RangeEnd|Reference)\b[^>]*?/>"
+)
+_AUTHOR_ATTR_RE = re.compile(r'w:author="([^"]*)"')
+_INITIALS_ATTR_RE = re.compile(r'w:initials="[^"]*"')
+_WT_ELEMENT_RE = re.compile(r"(<w:t(?:\s[^>]*)?>)(.*?)(</w:t>)", re.DOTALL)
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -104,58 +124,45 @@ def inspect_comments(
     """
     doc_path = Path(doc_path)
 
+    comments: list[CommentInfo] = []
+    # Insertion-ordered, so authors come out in first-seen order.
+    authors_by_name: dict[str, CommentAuthor] = {}
+
     with zipfile.ZipFile(doc_path, "r") as zf:
         if "word/comments.xml" not in zf.namelist():
             return [], []
 
-        xml_data = zf.read("word/comments.xml")
-
-    root = _safe_fromstring(xml_data)
-
-    comments: list[CommentInfo] = []
-    author_order: list[str] = []  # preserves first-seen order
-    author_counts: dict[str, int] = {}
-    author_initials_map: dict[str, str] = {}
-
-    for idx, comment_el in enumerate(root.findall(_TAG_COMMENT)):
-        comment_id = comment_el.get(_ATTR_ID, "")
-        author = comment_el.get(_ATTR_AUTHOR, "")
-        initials = comment_el.get(_ATTR_INITIALS, "")
-        date = comment_el.get(_ATTR_DATE, "")
-        text = _extract_comment_text(comment_el)
-
-        comments.append(
-            CommentInfo(
-                id=comment_id,
-                author=author,
-                author_initials=initials,
-                date=date,
-                text=text,
-                paragraph_index=idx,
-            )
-        )
+        with zf.open("word/comments.xml") as xml_file:
+            for idx, comment_el in enumerate(_iter_comment_elements(xml_file)):
+                comment_id = comment_el.get(_ATTR_ID, "")
+                author = comment_el.get(_ATTR_AUTHOR, "")
+                initials = comment_el.get(_ATTR_INITIALS, "")
+                date = comment_el.get(_ATTR_DATE, "")
+                text = _extract_comment_text(comment_el)
+
+                comments.append(
+                    CommentInfo(
+                        id=comment_id,
+                        author=author,
+                        author_initials=initials,
+                        date=date,
+                        text=text,
+                        paragraph_index=idx,
+                    )
+                )
 
-        # Track unique authors in first-seen order
-        if author not in author_counts:
-            author_order.append(author)
-            author_counts[author] = 0
-            author_initials_map[author] = initials
-        author_counts[author] += 1
-
-    # Build author list with suggested labels
-    authors: list[CommentAuthor] = []
-    for i, name in enumerate(author_order):
-        label = _reviewer_label(i)
-        authors.append(
-            CommentAuthor(
-                name=name,
-                initials=author_initials_map[name],
-                comment_count=author_counts[name],
-                suggested_label=label,
-            )
-        )
+                # Track unique authors, labelled in first-seen order
+                comment_author = authors_by_name.get(author)
+                if comment_author is None:
+                    comment_author = CommentAuthor(
+                        name=author,
+                        initials=initials,
+                        suggested_label=_reviewer_label(len(authors_by_name)),
+                    )
+                    authors_by_name[author] = comment_author
+                comment_author.comment_count += 1
 
-    return comments, authors
+    return comments, list(authors_by_name.values())
 
 
 def process_comments(
@@ -215,29 +222,33 @@ def process_comments(
 
     buf = BytesIO()
     with zipfile.ZipFile(BytesIO(input_bytes), "r") as zin, \
-         zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zout:
+         zipfile.ZipFile(
+             buf, "w", zipfile.ZIP_DEFLATED, compresslevel=_REWRITE_COMPRESSLEVEL,
+         ) as zout:
 
         for item in zin.infolist():
-            raw = zin.read(item.filename)
+            raw = None
 
-            if mode == CommentMode.KEEP:
-                pass  # Leave comments untouched
-
-            elif mode == CommentMode.STRIP:
+            if mode == CommentMode.STRIP:
                 if item.filename == "word/comments.xml":
-                    raw = _strip_all_comments(raw)
+                    raw = _strip_all_comments(zin.read(item.filename))
                 elif item.filename == "word/document.xml":
-                    raw = _strip_comment_references(raw)
+                    raw = _strip_comment_references(zin.read(item.filename))
 
             elif mode == CommentMode.SANITIZE:
                 if item.filename == "word/comments.xml":
                     raw, effective_mapping = _anonymize_comments(
-                        raw,
+                        zin.read(item.filename),
                         author_mapping,
                         content_replacements,
                     )
 
-            zout.writestr(item, raw)
+            # KEEP mode, and every part the active mode does not touch, is
+            # copied through unchanged.
+            if raw is None:
+                zout.writestr(item, zin.read(item.filename))
+            else:
+                zout.writestr(item, raw, compresslevel=_REWRITE_COMPRESSLEVEL)
 
     output_path.write_bytes(buf.getvalue())
     return effective_mapping
@@ -268,47 +279,64 @@ def restore_comment_authors(
     input_path = Path(input_path)
     output_path = Path(output_path)
 
-    input_bytes = input_path.read_bytes()
+    output_bytes = restore_comment_authors_bytes(input_path.read_bytes(), author_mapping)
+    output_path.write_bytes(output_bytes)
+
+
+def restore_comment_authors_bytes(
+    docx_bytes: bytes,
+    author_mapping: dict[str, str],
+) -> bytes:
+    """
+    In-memory variant of :func:`restore_comment_authors`.
+
+    Takes the raw bytes of a .docx archive and returns the rewritten archive,
+    so callers that already hold the document in memory (e.g. the uncloaker)
+    can avoid an extra write/read of the file on disk.
+
+    Args:
+        docx_bytes: Raw bytes of the cloaked .docx file.
+        author_mapping: Dict of ``anonymous_label -> original_author``.
+
+    Returns:
+        The bytes of the restored .docx archive.  If *author_mapping* is
+        empty, *docx_bytes* is returned unchanged.
+    """
+    if not author_mapping:
+        return docx_bytes
 
     buf = BytesIO()
-    with zipfile.ZipFile(BytesIO(input_bytes), "r") as zin, \
-         zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zout:
+    with zipfile.ZipFile(BytesIO(docx_bytes), "r") as zin, \
+         zipfile.ZipFile(
+             buf, "w", zipfile.ZIP_DEFLATED, compresslevel=_REWRITE_COMPRESSLEVEL,
+         ) as zout:
 
         for item in zin.infolist():
-            raw = zin.read(item.filename)
-
-            if item.filename == "word/comments.xml":
-                xml_str = raw.decode("utf-8")
-
-                # Reverse mapping: label -> original name
-                def _restore_attrs(match: re.Match) -> str:
-                    tag = match.group(0)
-                    author_match = re.search(r'w:author="([^"]*)"', tag)
-                    if author_match:
-                        label = author_match.group(1)
-                        if label in author_mapping:
-                            original_name = _escape_xml_attr(author_mapping[label])
-                            original_initials = _escape_xml_attr(
-                                generate_initials(author_mapping[label])
-                            )
-                            tag = re.sub(
-                                r'w:author="[^"]*"',
-                                f'w:author="{original_name}"',
-                                tag,
-                            )
-                            tag = re.sub(
-                                r'w:initials="[^"]*"',
-                                f'w:initials="{original_initials}"',
-                                tag,
-                            )
-                    return tag
-
-                xml_str = re.sub(r"<w:comment\s[^>]*?>", _restore_attrs, xml_str)
-                raw = xml_str.encode("utf-8")
-
-            zout.writestr(item, raw)
+            if item.filename != "word/comments.xml":
+                zout.writestr(item, zin.read(item.filename))
+                continue
+
+            xml_str = zin.read(item.filename).decode("utf-8")
+
+            # Reverse mapping: label -> original name
+            attr_values = _author_attr_values(author_mapping)
+
+            def _restore_attrs(match: re.Match) -> str:
+                tag = match.group(0)
+                author_match = _AUTHOR_ATTR_RE.search(tag)
+                if author_match:
+                    attrs = attr_values.get(author_match.group(1))
+                    if attrs is not None:
+                        tag = _AUTHOR_ATTR_RE.sub(attrs[0], tag)
+                        tag = _INITIALS_ATTR_RE.sub(attrs[1], tag)
+                return tag
+
+            xml_str = _COMMENT_OPEN_TAG_RE.sub(_restore_attrs, xml_str)
+            zout.writestr(
+                item, xml_str.encode("utf-8"), compresslevel=_REWRITE_COMPRESSLEVEL,
+            )
 
-    output_path.write_bytes(buf.getvalue())
+    return buf.getvalue()
 
 
 def generate_initials(label: str) -> str:
@@ -353,7 +381,7 @@ def _strip_all_comments(xml_data: bytes) -> bytes:
         Cleaned XML bytes.
     """
     xml_str = xml_data.decode("utf-8")
-    xml_str = re.sub(r"<w:comment\s[^>]*>[\s\S]*?</w:comment>", "", xml_str)
+    xml_str = _COMMENT_ELEMENT_RE.sub("", xml_str)
     return xml_str.encode("utf-8")
 
 
@@ -377,9 +405,7 @@ def _strip_comment_references(xml_data: bytes) -> bytes:
         Cleaned XML bytes with comment markers removed.
     """
     xml_str = xml_data.decode("utf-8")
-    xml_str = re.sub(r"<w:commentRangeStart\b[^>]*?/>", "", xml_str)
-    xml_str = re.sub(r"<w:commentRangeEnd\b[^>]*?/>", "", xml_str)
-    xml_str = re.sub(r"<w:commentReference\b[^>]*?/>", "", xml_str)
+    xml_str = _COMMENT_MARKER_RE.sub("", xml_str)
     return xml_str.encode("utf-8")
 
 
@@ -412,11 +438,10 @@ def _anonymize_comments(
         - The effective author mapping used (including auto-generated entries).
     """
     # Step 1: Parse read-only to build the effective author mapping
-    root = _safe_fromstring(xml_data)
     effective_mapping = dict(author_mapping)
     auto_index = len(author_mapping)
 
-    for comment_el in root.findall(_TAG_COMMENT):
+    for comment_el in _iter_comment_elements(BytesIO(xml_data)):
         original_author = comment_el.get(_ATTR_AUTHOR, "")
 
         if original_author and original_author not in effective_mapping:
@@ -426,33 +451,28 @@ def _anonymize_comments(
 
     # Step 2: Apply changes via regex on raw XML to preserve namespaces
     xml_str = xml_data.decode("utf-8")
+    attr_values = _author_attr_values(effective_mapping)
 
     def _replace_attrs(match: re.Match) -> str:
         tag = match.group(0)
-        author_match = re.search(r'w:author="([^"]*)"', tag)
+        author_match = _AUTHOR_ATTR_RE.search(tag)
         if author_match:
-            original_author = author_match.group(1)
-            if original_author in effective_mapping:
-                new_label = _escape_xml_attr(effective_mapping[original_author])
-                new_initials = _escape_xml_attr(
-                    generate_initials(effective_mapping[original_author])
-                )
-                tag = re.sub(r'w:author="[^"]*"', f'w:author="{new_label}"', tag)
-                tag = re.sub(r'w:initials="[^"]*"', f'w:initials="{new_initials}"', tag)
+            attrs = attr_values.get(author_match.group(1))
+            if attrs is not None:
+                tag = _AUTHOR_ATTR_RE.sub(attrs[0], tag)
+                tag = _INITIALS_ATTR_RE.sub(attrs[1], tag)
         return tag
 
-    xml_str = re.sub(r"<w:comment\s[^>]*?>", _replace_attrs, xml_str)
+    xml_str = _COMMENT_OPEN_TAG_RE.sub(_replace_attrs, xml_str)
 
     # Apply content replacements (SANITIZE mode)
     # Replacements are restricted to text inside <w:t> elements so that
     # XML tag names and attributes are never accidentally modified.
     # Case-insensitive, longest-first to prevent partial-match clobbering.
+    # One matcher is built per call and reused for every <w:t> node; it is
+    # an Aho-Corasick automaton when pyahocorasick is installed.
     if content_replacements:
-        sorted_keys = sorted(content_replacements.keys(), key=len, reverse=True)
-        content_pattern = re.compile(
-            "|".join(re.escape(k) for k in sorted_keys),
-            flags=re.IGNORECASE,
-        )
+        content_pattern = compile_literals(content_replacements.keys())
         lookup = {k.lower(): v for k, v in content_replacements.items()}
 
         def _replace_in_wt(wt_match: re.Match) -> str:
@@ -465,12 +485,7 @@ def _anonymize_comments(
             )
             return tag_open + xml_escape(new_text) + tag_close
 
-        xml_str = re.sub(
-            r"(<w:t(?:\s[^>]*)?>)(.*?)(</w:t>)",
-            _replace_in_wt,
-            xml_str,
-            flags=re.DOTALL,
-        )
+        xml_str = _WT_ELEMENT_RE.sub(_replace_in_wt, xml_str)
 
     return xml_str.encode("utf-8"), effective_mapping
 
@@ -479,6 +494,51 @@ def _anonymize_comments(
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _author_attr_values(author_mapping: dict[str, str]) -> dict[str, tuple[str, str]]:
+    """
+    Precompute the replacement ``w:author`` / ``w:initials`` attributes.
+
+    Comments by the same author share these values, so the escaping and
+    :func:`generate_initials` run once per author instead of once per
+    ``<w:comment>`` tag.
+
+    Args:
+        author_mapping: Dict of current author value -> new author name.
+
+    Returns:
+        Dict of current author value -> ``(author_attr, initials_attr)``,
+        each a complete ``name="value"`` attribute string.
+    """
+    return {
+        current: (
+            f'w:author="{_escape_xml_attr(new_name)}"',
+            f'w:initials="{_escape_xml_attr(generate_initials(new_name))}"',
+        )
+        for current, new_name in author_mapping.items()
+    }
+
+
+def _iter_comment_elements(xml_file) -> Iterator[ET.Element]:
+    """
+    Stream the ``<w:comment>`` elements of ``word/comments.xml``.
+
+    Parses incrementally with ``iterparse`` and clears each comment once the
+    caller has moved on, so memory stays bounded by the largest single
+    comment rather than the whole file.  Read-only: elements must not be
+    kept past the next iteration.
+
+    Args:
+        xml_file: A binary file-like object holding ``word/comments.xml``.
+
+    Yields:
+        Each fully parsed ``<w:comment>`` element, in document order.
+    """
+    for _event, el in _safe_iterparse(xml_file, events=("end",)):
+        if el.tag == _TAG_COMMENT:
+            yield el
+            el.clear()
+
+
 def _extract_comment_text(comment_el: ET.Element) -> str:
     """
     Extract the plain-text content from a ``<w:comment>`` element.
@@ -9,11 +9,15 @@ as an additional backend — both feed the same DetectedEntity model.
 
 from __future__ import annotations
 
+import functools
+import heapq
 import logging
 import os
 import re
 import sys
+import threading
 from collections import Counter
+from operator import attrgetter
 
 from .models import DetectedEntity
 
@@ -56,11 +60,36 @@ ENTITY_PATTERNS: dict[str, str] = {
     "URL": r"(?:https?://)?(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}(?:/[^\s,)]*)?(?<![.,)])",
 }
 
-# Pre-compile for performance
+# Pre-compile for performance.  Each type is scanned with its own pattern:
+# CPython's engine can skip ahead on a single pattern's leading literal or
+# character set, which it cannot do for a fused alternation of all types
+# (measured ~30% slower on contract text).  DFA engines such as RE2 or
+# Hyperscan are not an option either, as PHONE and URL rely on lookbehind.
 _COMPILED_PATTERNS: dict[str, re.Pattern[str]] = {
     name: re.compile(pattern) for name, pattern in ENTITY_PATTERNS.items()
 }
 
+# A character every match of the type must contain.  When the text lacks it
+# the scan is skipped outright (most contracts have no "@" or "$").
+_ENTITY_REQUIRED_CHARS: dict[str, str] = {
+    "EMAIL": "@",
+    "SSN": "-",
+    "EIN": "-",
+    "AMOUNT": "$",
+    "ADDRESS": ",",
+    "URL": ".",
+}
+
+# Types whose every match contains a digit; skipped on digit-free text.
+_ENTITY_NEEDS_DIGIT = frozenset({"PHONE", "SSN", "EIN", "AMOUNT", "ADDRESS"})
+
+# Placeholder labels by entity type, precomputed for the types detected here.
+# Other types (e.g. GLiNER labels) are capitalized by generate_placeholder.
+_PLACEHOLDER_LABELS: dict[str, str] = {
+    entity_type: entity_type.capitalize()
+    for entity_type in (*ENTITY_PATTERNS, "PERSON", "DATE", "COMPANY")
+}
+
 # Context-aware bare-number pattern for amounts without $ prefix.
 _BARE_AMOUNT_RE = re.compile(
     r'(?:exceed|up to|maximum of|total of|aggregate of|limit of|not to exceed|'
@@ -126,6 +155,42 @@ _US_STATE_ABBREVS = (
     "OR|PA|RI|SC|SD|TN|TX|UT|VT|VA|WA|WV|WI|WY|DC"
 )
 
+
+def _trie_alternation(words: list[str]) -> str:
+    """Build a regex alternation of *words* factored on common prefixes.
+
+    ``["North Carolina", "North Dakota", "NC"]`` becomes
+    ``N(?:C|orth\\ (?:Carolina|Dakota))``.  CPython's engine only factors a
+    prefix shared by every branch, so a flat list of 100+ names is tried
+    branch by branch at each candidate position; the factored form rejects
+    a mismatch after the first differing character.  Where one word is a
+    prefix of another, the longer one is tried first.
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: dict[str, dict]) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return emit(trie)
+
+
+# Full state names and abbreviations, as one factored alternation.
+_US_STATE_ALTERNATION = _trie_alternation(
+    [*_US_STATES.split("|"), *_US_STATE_ABBREVS.split("|")]
+)
+
 # Context-based city/state location patterns (no street address required).
 # Catches references like "in Seattle, Washington" that lack a street
 # address but are still identifying information in legal documents.
@@ -134,14 +199,14 @@ _CITY_STATE_PATTERNS: list[re.Pattern[str]] = [
     re.compile(
         r'\b(?:in|at|of|from|to|near)\s+'
         r'((?:[A-Z][A-Za-z.\']+\s+){0,3}[A-Z][A-Za-z.\']+'
-        r',\s*(?:' + _US_STATES + r'|' + _US_STATE_ABBREVS + r')'
+        r',\s*(?:' + _US_STATE_ALTERNATION + r')'
         r'(?:[,\s]+' + _POSTAL_CODE + r')?)'
         r'\b',
     ),
     # City, State on its own line (signature blocks)
     re.compile(
         r'^\s*((?:[A-Z][A-Za-z.\']+\s+){0,3}[A-Z][A-Za-z.\']+'
-        r',\s*(?:' + _US_STATES + r'|' + _US_STATE_ABBREVS + r')'
+        r',\s*(?:' + _US_STATE_ALTERNATION + r')'
         r'(?:[,\s]+' + _POSTAL_CODE + r')?)'
         r'\s*$',
         re.MULTILINE,
@@ -251,6 +316,15 @@ _ADDRESS_FALSE_POSITIVES = frozenset({
     "premises", "property", "office", "offices",
 })
 
+# Runs of ASCII letters, used to split entity text into words.
+_ALPHA_WORD_RE = re.compile(r'[A-Za-z]+')
+
+# Any decimal digit; a real street address has a number in it.
+_DIGIT_RE = re.compile(r'\d')
+
+# Sentence boundary for GLiNER chunking: whitespace after . ! or ?
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
 
 def _filter_gliner_entity(text: str, entity_type: str) -> str | None:
     """Apply post-processing filters to a single GLiNER entity.
@@ -290,8 +364,8 @@ def _filter_gliner_entity(text: str, entity_type: str) -> str | None:
             return None
 
         # Reject institutional/regulatory organizations.
-        entity_words_lower = [w.lower() for w in re.findall(r'[A-Za-z]+', stripped)]
-        if any(w in _INSTITUTIONAL_ORG_WORDS for w in entity_words_lower):
+        entity_words = _ALPHA_WORD_RE.findall(stripped)
+        if not _INSTITUTIONAL_ORG_WORDS.isdisjoint(w.lower() for w in entity_words):
             return None
 
         # Reject legal statutes: entities ending with Act, Code, etc.
@@ -301,8 +375,7 @@ def _filter_gliner_entity(text: str, entity_type: str) -> str | None:
 
         # Reject known legal abbreviations — exact match or any word/parenthetical
         # in the entity (catches "Securities and Exchange Commission (SEC)").
-        entity_words = re.findall(r'[A-Za-z]+', stripped)
-        if any(w in _LEGAL_ABBREVIATIONS for w in entity_words):
+        if not _LEGAL_ABBREVIATIONS.isdisjoint(entity_words):
             return None
 
         # Reject all-caps 2-5 letter entities that aren't corporate suffixes.
@@ -315,7 +388,7 @@ def _filter_gliner_entity(text: str, entity_type: str) -> str | None:
         if stripped.lower() in _ADDRESS_FALSE_POSITIVES:
             return None
         # Reject phrases without digits — real addresses have street numbers.
-        if not any(c.isdigit() for c in stripped):
+        if not _DIGIT_RE.search(stripped):
             return None
 
     return stripped
@@ -324,6 +397,11 @@ def _filter_gliner_entity(text: str, entity_type: str) -> str | None:
 # Module-level singleton for the GLiNER model (lazy-loaded).
 _gliner_model = None
 _gliner_import_failed = False
+# True when the loaded model has batch_predict_entities(), which pads
+# several chunks into one forward pass (the ONNX backend, and GLiNER
+# releases that provide it).
+_gliner_model_batches = False
+_gliner_load_lock = threading.Lock()
 
 
 def _get_gliner_model(model_name: str = "urchade/gliner_multi_pii-v1"):
@@ -340,13 +418,38 @@ def _get_gliner_model(model_name: str = "urchade/gliner_multi_pii-v1"):
     Uses a circuit breaker so that repeated calls after a failed load
     return immediately without retrying.
     """
-    global _gliner_model, _gliner_import_failed
-
     if _gliner_import_failed:
         return None
     if _gliner_model is not None:
         return _gliner_model
 
+    # The web UI runs detection in worker threads, so several requests (or
+    # the startup preload) can arrive here at once.  Only the first loads
+    # the model; the others wait for it and reuse the result.
+    with _gliner_load_lock:
+        if _gliner_import_failed:
+            return None
+        if _gliner_model is not None:
+            return _gliner_model
+        return _load_gliner_model(model_name)
+
+
+def preload_gliner_model() -> threading.Thread:
+    """Start loading the NER model on a background daemon thread.
+
+    Lets a long-running server pay the model load at startup instead of on
+    its first detection request.  Detection calls made before the load
+    finishes simply wait for it.
+    """
+    thread = threading.Thread(target=_get_gliner_model, name="gliner-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+def _load_gliner_model(model_name: str):
+    """Load the first available NER backend; called with the load lock held."""
+    global _gliner_model, _gliner_import_failed, _gliner_model_batches
+
     # --- Try 1: Bundled ONNX model ---
     onnx_dir = os.environ.get("CLIENTCLOAK_ONNX_MODEL_DIR")
     if not onnx_dir and getattr(sys, "frozen", False):
@@ -357,6 +460,7 @@ def _get_gliner_model(model_name: str = "urchade/gliner_multi_pii-v1"):
 
             logger.info("Loading ONNX NER model from: %s", onnx_dir)
             _gliner_model = load_onnx_model(onnx_dir)
+            _gliner_model_batches = True
             logger.info("ONNX NER model loaded successfully.")
             return _gliner_model
         except Exception:
@@ -372,6 +476,9 @@ def _get_gliner_model(model_name: str = "urchade/gliner_multi_pii-v1"):
 
         logger.info("Loading GLiNER model: %s", model_name)
         _gliner_model = GLiNER.from_pretrained(model_name)
+        _gliner_model_batches = callable(
+            getattr(_gliner_model, "batch_predict_entities", None)
+        )
         logger.info("GLiNER model loaded successfully.")
         return _gliner_model
     except Exception:
@@ -400,14 +507,16 @@ def _chunk_text(
     if not text or not text.strip():
         return []
 
-    sentences = re.split(r'(?<=[.!?])\s+', text)
     chunks: list[tuple[str, int]] = []
     current_sentences: list[str] = []
+    # Word count of each buffered sentence, so the overlap never re-splits.
+    current_counts: list[int] = []
     current_word_count = 0
     current_char_offset = 0
 
-    for sentence in sentences:
-        sentence_words = len(sentence.split())
+    for sentence in _SENTENCE_SPLIT_RE.split(text):
+        words = sentence.split()
+        sentence_words = len(words)
 
         # If a single sentence exceeds max_words, split it by word count
         if sentence_words > max_words:
@@ -417,9 +526,9 @@ def _chunk_text(
                 chunks.append((chunk_text, current_char_offset))
                 current_char_offset += len(chunk_text) + 1
                 current_sentences = []
+                current_counts = []
                 current_word_count = 0
 
-            words = sentence.split()
             for i in range(0, len(words), max_words - overlap_words):
                 word_slice = words[i:i + max_words]
                 chunk_text = " ".join(word_slice)
@@ -432,27 +541,27 @@ def _chunk_text(
             chunks.append((chunk_text, current_char_offset))
 
             # Build overlap from the tail of the current chunk
-            overlap_text_parts: list[str] = []
+            start = len(current_sentences)
             overlap_count = 0
-            for s in reversed(current_sentences):
-                s_words = len(s.split())
-                if overlap_count + s_words > overlap_words:
-                    break
-                overlap_text_parts.insert(0, s)
-                overlap_count += s_words
+            while start > 0 and overlap_count + current_counts[start - 1] <= overlap_words:
+                start -= 1
+                overlap_count += current_counts[start]
 
             # Compute new char offset
-            if overlap_text_parts:
-                overlap_str = " ".join(overlap_text_parts)
+            if start < len(current_sentences):
+                current_sentences = current_sentences[start:]
+                current_counts = current_counts[start:]
+                overlap_str = " ".join(current_sentences)
                 current_char_offset = current_char_offset + len(chunk_text) - len(overlap_str)
-                current_sentences = overlap_text_parts
                 current_word_count = overlap_count
             else:
                 current_char_offset += len(chunk_text) + 1
                 current_sentences = []
+                current_counts = []
                 current_word_count = 0
 
         current_sentences.append(sentence)
+        current_counts.append(sentence_words)
         current_word_count += sentence_words
 
     # Flush remaining sentences
@@ -469,20 +578,36 @@ def _run_gliner(text: str, threshold: float = 0.5) -> list[DetectedEntity]:
     Returns an empty list when GLiNER is not installed or the model
     fails to load.
     """
+    # Blank text must not trigger a model load just to find nothing.
+    if not text or text.isspace():
+        return []
+
     model = _get_gliner_model()
     if model is None:
         return []
 
-    chunks = _chunk_text(text)
+    chunk_texts = [chunk_text for chunk_text, _char_offset in _chunk_text(text)]
     entities: list[DetectedEntity] = []
     type_counters: dict[str, int] = {}
+    predict_threshold = min(_GLINER_THRESHOLDS.values())
 
-    for chunk_text, _char_offset in chunks:
-        predictions = model.predict_entities(
-            chunk_text, _GLINER_LABELS,
-            threshold=min(_GLINER_THRESHOLDS.values()),
+    if _gliner_model_batches:
+        chunk_predictions = model.batch_predict_entities(
+            chunk_texts, _GLINER_LABELS,
+            threshold=predict_threshold,
             flat_ner=True,
         )
+    else:
+        chunk_predictions = (
+            model.predict_entities(
+                chunk_text, _GLINER_LABELS,
+                threshold=predict_threshold,
+                flat_ner=True,
+            )
+            for chunk_text in chunk_texts
+        )
+
+    for predictions in chunk_predictions:
         for pred in predictions:
             gliner_label = pred["label"]
             label_threshold = _GLINER_THRESHOLDS.get(gliner_label, threshold)
@@ -519,11 +644,12 @@ def _reassign_placeholders(entities: list[DetectedEntity]) -> list[DetectedEntit
     type_counters: dict[str, int] = {}
     result: list[DetectedEntity] = []
     for entity in entities:
-        type_counters[entity.entity_type] = type_counters.get(entity.entity_type, 0) + 1
-        idx = type_counters[entity.entity_type]
-        result.append(entity.model_copy(update={
-            "suggested_placeholder": generate_placeholder(entity.entity_type, idx),
-        }))
+        idx = type_counters[entity.entity_type] = type_counters.get(entity.entity_type, 0) + 1
+        placeholder = generate_placeholder(entity.entity_type, idx)
+        # Entities that already carry the right number are reused as-is.
+        if entity.suggested_placeholder != placeholder:
+            entity = entity.model_copy(update={"suggested_placeholder": placeholder})
+        result.append(entity)
     return result
 
 
@@ -542,7 +668,7 @@ def generate_placeholder(entity_type: str, index: int) -> str:
         A bracketed placeholder string.
     """
     # Title-case the type for readability: EMAIL -> Email, SSN -> Ssn
-    label = entity_type.capitalize()
+    label = _PLACEHOLDER_LABELS.get(entity_type) or entity_type.capitalize()
     return f"[{label}-{index}]"
 
 
@@ -558,16 +684,28 @@ def deduplicate_entities(entities: list[DetectedEntity]) -> list[DetectedEntity]
         Deduplicated list with merged counts and max confidence.
     """
     seen: dict[tuple[str, str], DetectedEntity] = {}
+    # Running totals for keys seen more than once.  The merged entity is
+    # copied once at the end instead of on every duplicate, and the
+    # caller's entities are never mutated.
+    merged: dict[tuple[str, str], list] = {}
     for entity in entities:
         key = (entity.text, entity.entity_type)
-        if key in seen:
-            existing = seen[key]
-            seen[key] = existing.model_copy(update={
-                "count": existing.count + entity.count,
-                "confidence": max(existing.confidence, entity.confidence),
-            })
-        else:
+        existing = seen.get(key)
+        if existing is None:
             seen[key] = entity
+            continue
+        totals = merged.get(key)
+        if totals is None:
+            merged[key] = [existing.count + entity.count,
+                           max(existing.confidence, entity.confidence)]
+        else:
+            totals[0] += entity.count
+            if entity.confidence > totals[1]:
+                totals[1] = entity.confidence
+    for key, (count, confidence) in merged.items():
+        seen[key] = seen[key].model_copy(
+            update={"count": count, "confidence": confidence},
+        )
     return list(seen.values())
 
 
@@ -587,27 +725,40 @@ def detect_entities_regex(text: str) -> list[DetectedEntity]:
     Returns:
         List of DetectedEntity instances, one per unique match text per type.
     """
+    if not text or text.isspace():
+        return []
+
     entities: list[DetectedEntity] = []
-    email_texts: set[str] = set()
+    email_blob = ""
+
+    # Dates, amounts and street numbers all need a digit; look for one once
+    # and skip those scans on text that has none.
+    has_digit = _DIGIT_RE.search(text) is not None
 
     # First pass: collect all matches by type
     matches_by_type: dict[str, Counter] = {}
     for entity_type, pattern in _COMPILED_PATTERNS.items():
+        required = _ENTITY_REQUIRED_CHARS.get(entity_type)
+        if required and required not in text:
+            continue
+        if not has_digit and entity_type in _ENTITY_NEEDS_DIGIT:
+            continue
         matches = pattern.findall(text)
         if matches:
             matches_by_type[entity_type] = Counter(matches)
 
-    # Collect email texts for URL dedup
+    # Join the email texts for URL dedup.  Neither pattern can match
+    # whitespace, so a URL found in the newline-joined blob is a substring of
+    # a single email and one ``in`` check replaces a scan over every email.
     if "EMAIL" in matches_by_type:
-        email_texts = set(matches_by_type["EMAIL"].keys())
+        email_blob = "\n".join(matches_by_type["EMAIL"])
 
     for entity_type, counts in matches_by_type.items():
         idx = 0
         for match_text, count in counts.most_common():
             # Filter out URL matches that are substrings of detected emails
-            if entity_type == "URL" and email_texts:
-                if any(match_text in email for email in email_texts):
-                    continue
+            if entity_type == "URL" and match_text in email_blob:
+                continue
             idx += 1
             entities.append(DetectedEntity(
                 text=match_text,
@@ -627,8 +778,7 @@ def detect_entities_regex(text: str) -> list[DetectedEntity]:
             if name[0].islower():
                 continue
             # Filter false positives: skip if any word is a known place/legal term
-            name_words = name.split()
-            if any(w in _PERSON_FALSE_POSITIVE_WORDS for w in name_words):
+            if not _PERSON_FALSE_POSITIVE_WORDS.isdisjoint(name.split()):
                 continue
             person_counts[name] += 1
     for idx, (name, count) in enumerate(person_counts.most_common(), 1):
@@ -642,7 +792,7 @@ def detect_entities_regex(text: str) -> list[DetectedEntity]:
 
     # Context-based date detection
     date_counts: Counter = Counter()
-    for pattern in _DATE_PATTERNS:
+    for pattern in _DATE_PATTERNS if has_digit else ():
         for match in pattern.finditer(text):
             date_counts[match.group(0).strip()] += 1
     for idx, (date_text, count) in enumerate(date_counts.most_common(), 1):
@@ -656,11 +806,13 @@ def detect_entities_regex(text: str) -> list[DetectedEntity]:
 
     # Context-based city/state location detection (no street required).
     # Catches "in Seattle, Washington", "New York, NY" on its own line, etc.
-    existing_addresses = {e.text for e in entities if e.entity_type == "ADDRESS"}
+    # matches_by_type already buckets the pattern hits by type, so the
+    # per-type lookups below never rescan the entity list.
+    existing_addresses = set(matches_by_type.get("ADDRESS", ()))
     address_idx = len(existing_addresses)
     city_state_counts: Counter = Counter()
     city_state_canonical: dict[str, str] = {}
-    for pattern in _CITY_STATE_PATTERNS:
+    for pattern in _CITY_STATE_PATTERNS if "," in text else ():
         for match in pattern.finditer(text):
             location = match.group(1).strip()
             # Skip if already detected by the full ADDRESS pattern
@@ -688,7 +840,7 @@ def detect_entities_regex(text: str) -> list[DetectedEntity]:
     # Catches addresses like "5959 Las Colinas Boulevard" split across lines.
     street_counts: Counter = Counter()
     street_canonical: dict[str, str] = {}
-    for pattern in _STREET_ADDRESS_PATTERNS:
+    for pattern in _STREET_ADDRESS_PATTERNS if has_digit else ():
         for match in pattern.finditer(text):
             street = match.group(1).strip()
             # Skip if already detected by full ADDRESS or city-state patterns
@@ -713,9 +865,9 @@ def detect_entities_regex(text: str) -> list[DetectedEntity]:
         existing_addresses.add(street)
 
     # Context-based bare amount detection (no $ prefix required)
-    existing_amounts = {e.text for e in entities if e.entity_type == "AMOUNT"}
-    amount_idx = len([e for e in entities if e.entity_type == "AMOUNT"])
-    for match in _BARE_AMOUNT_RE.finditer(text):
+    existing_amounts = set(matches_by_type.get("AMOUNT", ()))
+    amount_idx = len(existing_amounts)
+    for match in _BARE_AMOUNT_RE.finditer(text) if has_digit else ():
         amount_text = match.group(1).strip()
         if amount_text not in existing_amounts:
             amount_idx += 1
@@ -723,7 +875,7 @@ def detect_entities_regex(text: str) -> list[DetectedEntity]:
                 text=amount_text,
                 entity_type="AMOUNT",
                 confidence=0.9,
-                count=len(re.findall(re.escape(amount_text), text)),
+                count=text.count(amount_text),
                 suggested_placeholder=generate_placeholder("AMOUNT", amount_idx),
             ))
             existing_amounts.add(amount_text)
@@ -732,16 +884,12 @@ def detect_entities_regex(text: str) -> list[DetectedEntity]:
     # Catches third-party references like "Adventura Properties, LLC" that
     # lack parenthetical defined terms and wouldn't be found by
     # detect_party_names (which only scans the preamble).
-    _bare_suffix_re = re.compile(
-        r',?\s*(?:' + _SUFFIX_PATTERN + r')\.?\s*$', re.IGNORECASE,
-    )
-    # Common determiners that can start a false-positive match
-    # (e.g. "The Services", "This Agreement").
-    _determiner_re = re.compile(
-        r'^(?:The|This|That|These|Those|A|An)\s+', re.IGNORECASE,
-    )
     company_counts: Counter = Counter()
-    company_canonical: dict[str, str] = {}  # lowered name -> first-seen case form
+    company_canonical: dict[str, str] = {}  # casefolded name -> first-seen case form
+    # The name-only filters below are run once per distinct name; later
+    # hits reuse the outcome.
+    accepted_names: dict[str, str] = {}  # name -> canonical form
+    rejected_names: set[str] = set()
     for match in _COMPANY_SUFFIX_RE.finditer(text):
         # Ensure the suffix isn't mid-word (e.g. "County" matching "Co")
         end_pos = match.end()
@@ -751,25 +899,15 @@ def detect_entities_regex(text: str) -> list[DetectedEntity]:
         if _followed_by_agreement_term(text, end_pos):
             continue
         name = match.group(1).strip().rstrip(",").rstrip(".")
-        # Skip bare suffixes (e.g. just "Services" with no real name words)
-        if not _bare_suffix_re.sub('', name).strip():
-            continue
-        # Skip matches that start with a common determiner
-        if _determiner_re.match(name):
-            continue
-        # Skip matches starting with "Dear " (letter salutation)
-        if name.startswith("Dear "):
-            continue
-        # Skip legal abbreviations caught by regex backtracking
-        # (e.g. "DTSA" split into name "DT" + suffix "SA").
-        name_collapsed = re.sub(r'[\s,.\-]+', '', name)
-        if name_collapsed in _LEGAL_ABBREVIATIONS:
-            continue
-        # Case-insensitive dedup: merge "VENTMARKET, LLC" with "VentMarket, LLC"
-        name_lower = name.lower()
-        if name_lower not in company_canonical:
-            company_canonical[name_lower] = name
-        company_counts[company_canonical[name_lower]] += 1
+        canonical = accepted_names.get(name)
+        if canonical is None:
+            if name in rejected_names or _is_rejected_company_name(name):
+                rejected_names.add(name)
+                continue
+            # Case-insensitive dedup: merge "VENTMARKET, LLC" with "VentMarket, LLC"
+            canonical = company_canonical.setdefault(name.casefold(), name)
+            accepted_names[name] = canonical
+        company_counts[canonical] += 1
     for idx, (name, count) in enumerate(company_counts.most_common(), 1):
         entities.append(DetectedEntity(
             text=name,
@@ -788,6 +926,7 @@ def detect_entities(
     gliner_threshold: float = 0.5,
     use_gliner: bool = True,
     max_chars: int = 0,
+    top_k: int | None = None,
 ) -> list[DetectedEntity]:
     """
     Detect entities in text using all available backends.
@@ -814,10 +953,16 @@ def detect_entities(
         max_chars: Maximum number of characters fed to GLiNER NER.
             Text beyond this limit is not scanned by NER (regex still
             scans the full document). 0 means no limit.
+        top_k: If given, return only the *top_k* most frequent entities
+            (selected without sorting the full list).
 
     Returns:
         List of DetectedEntity instances sorted by count (descending).
     """
+    # Nothing to detect in blank text; skip the regex scans and model load.
+    if not text or text.isspace():
+        return []
+
     # 1. Regex detection (always runs)
     entities = detect_entities_regex(text)
 
@@ -855,17 +1000,25 @@ def detect_entities(
     ]
 
     # 4. Filter out known party names.
-    # Normalize by stripping trailing periods/commas so "Acme Inc." and
-    # "Acme Inc" are treated as the same name.
+    # Normalize by casefolding and stripping trailing periods/commas so
+    # "Acme Inc." and "ACME INC" are treated as the same name.
     if party_names:
-        lower_names = {name.lower().rstrip(".,") for name in party_names if name}
+        folded_names = frozenset(
+            name.casefold().rstrip(".,") for name in party_names if name
+        )
         entities = [
             e for e in entities
-            if e.text.lower().rstrip(".,") not in lower_names
+            if e.text.casefold().rstrip(".,") not in folded_names
         ]
 
-    # 5. Sort by count descending, then by text for stability
-    entities.sort(key=lambda e: (-e.count, e.text))
+    # 5. Sort by count descending, then by text for stability.  Two stable
+    # sorts on attrgetter keys avoid building a key tuple per entity.  When
+    # only the top entries are wanted, a heap selects them in O(n log k).
+    if top_k is not None and top_k < len(entities):
+        entities = heapq.nsmallest(top_k, entities, key=lambda e: (-e.count, e.text))
+    else:
+        entities.sort(key=attrgetter("text"))
+        entities.sort(key=attrgetter("count"), reverse=True)
 
     # 6. Re-number placeholders sequentially after merge/filter
     entities = _reassign_placeholders(entities)
@@ -873,6 +1026,58 @@ def detect_entities(
     return entities
 
 
+def detect_entities_batch(
+    texts: list[str],
+    party_names: list[str] | None = None,
+    gliner_threshold: float = 0.5,
+    use_gliner: bool = True,
+    max_chars: int = 0,
+    max_workers: int | None = None,
+) -> list[list[DetectedEntity]]:
+    """
+    Run :func:`detect_entities` over several independent documents.
+
+    Regex scanning holds the GIL, so documents are spread across worker
+    processes rather than threads.  Each worker compiles the module-level
+    patterns (and loads the NER model, when enabled) once and reuses them
+    for every document it is given.
+
+    Args:
+        texts: Full text of each document.
+        party_names: Party names to exclude, applied to every document.
+        gliner_threshold: Confidence threshold for GLiNER results.
+        use_gliner: If True, attempt GLiNER NER detection in each worker.
+        max_chars: Maximum number of characters fed to GLiNER NER per
+            document. 0 means no limit.
+        max_workers: Number of worker processes; defaults to the CPU count.
+            With one worker, or a single document, everything runs in the
+            calling process.
+
+    Returns:
+        One :func:`detect_entities` result per input text, in input order.
+    """
+    detect = functools.partial(
+        detect_entities,
+        party_names=party_names,
+        gliner_threshold=gliner_threshold,
+        use_gliner=use_gliner,
+        max_chars=max_chars,
+    )
+    if len(texts) <= 1 or max_workers == 1:
+        return [detect(text) for text in texts]
+
+    # Imported here: concurrent.futures.process pulls in multiprocessing,
+    # which single-document callers should not pay for at import time.
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    workers = max_workers or os.cpu_count() or 1
+    # A few documents per task amortises the pickling round-trip while
+    # still leaving enough tasks to keep every worker busy.
+    chunksize = max(1, len(texts) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(detect, texts, chunksize=chunksize))
+
+
 # ---------------------------------------------------------------------------
 # Party name detection from legal preambles
 # ---------------------------------------------------------------------------
@@ -956,6 +1161,10 @@ _CORPORATE_SUFFIXES = (
 
 _SUFFIX_PATTERN = "|".join(_CORPORATE_SUFFIXES)
 
+# detect_party_names only looks at this many leading characters.  The text
+# is sliced once up front so no pattern ever scans past the preamble.
+_PREAMBLE_CHARS = 2000
+
 # Phase 1: Find a corporate suffix anchored to one or more preceding
 # capitalized words.  Allows an optional comma between the name and the
 # suffix (e.g. "Acme, Inc.").  Captures the full company name + suffix.
@@ -995,6 +1204,26 @@ _DEAR_RE = re.compile(
 )
 
 
+# A trailing corporate suffix with nothing required in front of it; a name
+# that is empty once this is removed is just a suffix (e.g. "Services").
+_BARE_SUFFIX_RE = re.compile(
+    r',?\s*(?:' + _SUFFIX_PATTERN + r')\.?\s*$', re.IGNORECASE,
+)
+
+# A trailing corporate suffix after the core name: "AiSim Inc." -> "AiSim".
+_TRAILING_SUFFIX_RE = re.compile(
+    r",?\s+(?:" + _SUFFIX_PATTERN + r")\s*$", re.IGNORECASE,
+)
+
+# Common determiners that can start a false-positive company match
+# (e.g. "The Services", "This Agreement").
+_LEADING_DETERMINER_RE = re.compile(
+    r'^(?:The|This|That|These|Those|A|An)\s+', re.IGNORECASE,
+)
+
+# Whitespace and punctuation collapsed away when comparing abbreviations.
+_SEPARATORS_RE = re.compile(r'[\s,.\-]+')
+
 # Default role labels assigned when the defined term is the company name itself.
 _DEFAULT_ROLE_LABELS = ("Company", "Counterparty")
 
@@ -1015,6 +1244,27 @@ _AGREEMENT_TYPE_TERMS = frozenset({
 _NEXT_WORD_RE = re.compile(r'\s+([A-Za-z]+)')
 
 
+def _is_bare_suffix(name: str) -> bool:
+    """True when the matched name is just a suffix with no real name words."""
+    return not _BARE_SUFFIX_RE.sub('', name).strip()
+
+
+def _is_rejected_company_name(name: str) -> bool:
+    """True when a corporate-suffix match is not a real company name."""
+    # Skip bare suffixes (e.g. just "Services" with no real name words)
+    if _is_bare_suffix(name):
+        return True
+    # Skip matches that start with a common determiner
+    if _LEADING_DETERMINER_RE.match(name):
+        return True
+    # Skip matches starting with "Dear " (letter salutation)
+    if name.startswith("Dear "):
+        return True
+    # Skip legal abbreviations caught by regex backtracking
+    # (e.g. "DTSA" split into name "DT" + suffix "SA").
+    return _SEPARATORS_RE.sub('', name) in _LEGAL_ABBREVIATIONS
+
+
 def _followed_by_agreement_term(text: str, end_pos: int) -> bool:
     """Return True if the next word after *end_pos* is a legal document type."""
     m = _NEXT_WORD_RE.match(text, end_pos)
@@ -1060,24 +1310,18 @@ def _label_resembles_name(label: str, name: str) -> bool:
     """
     # Strip suffix to get the core name, e.g. "AiSim Inc." -> "AiSim".
     # The ,? handles comma-separated forms like "VentMarket, LLC".
-    suffix_pattern = re.compile(
-        r",?\s+(?:" + _SUFFIX_PATTERN + r")\s*$",
-        re.IGNORECASE,
-    )
-    core = suffix_pattern.sub("", name).strip()
-    # Compare case-insensitively, ignoring whitespace differences
-    label_norm = re.sub(r"\s+", " ", label.strip()).lower()
-    core_norm = re.sub(r"\s+", " ", core).lower()
-    name_norm = re.sub(r"\s+", " ", name.strip()).lower()
+    core = _TRAILING_SUFFIX_RE.sub("", name).strip()
+    # Compare case-insensitively, ignoring whitespace differences.  Each
+    # string is split into words once and the word lists are compared.
+    label_words = label.casefold().split()
+    core_words = core.casefold().split()
 
     # Exact match with core or full name
-    if label_norm in (core_norm, name_norm) or core_norm == label_norm:
+    if label_words == core_words or label_words == name.casefold().split():
         return True
 
     # Label is a leading-word subset of the core name.
     # e.g., "BigOrg" is the first word of "BigOrg Group".
-    label_words = label_norm.split()
-    core_words = core_norm.split()
     if label_words and len(label_words) < len(core_words):
         if core_words[: len(label_words)] == label_words:
             return True
@@ -1123,16 +1367,20 @@ def detect_party_names(text: str) -> list[dict[str, str]]:
         E.g., ``[{"name": "Making Reign Inc.", "label": "Company",
         "defined_term": "Making Reign"}]``
     """
-    preamble = text[:2000]
+    if not text or text.isspace():
+        return []
+
+    preamble = text[:_PREAMBLE_CHARS]
     results: list[dict[str, str]] = []
     seen_names: set[str] = set()
     role_index = 0  # tracks which default role label to assign next
 
     def _add(name: str, label: str) -> None:
         nonlocal role_index
-        if name.lower() in seen_names:
+        key = name.lower()
+        if key in seen_names:
             return
-        seen_names.add(name.lower())
+        seen_names.add(key)
         entry: dict[str, str] = {"name": name, "label": label}
         if _label_resembles_name(label, name):
             # The defined term is a short form of the name — include it as
@@ -1154,18 +1402,6 @@ def detect_party_names(text: str) -> list[dict[str, str]]:
         role_index += 1
         results.append(entry)
 
-    _suffix_strip_re = re.compile(
-        r',?\s*(?:' + _SUFFIX_PATTERN + r')\.?\s*$', re.IGNORECASE,
-    )
-
-    def _is_bare_suffix(name: str) -> bool:
-        """True when the matched name is just a suffix with no real name words."""
-        return not _suffix_strip_re.sub('', name).strip()
-
-    _det_re = re.compile(
-        r'^(?:The|This|That|These|Those|A|An)\s+', re.IGNORECASE,
-    )
-
     # --- Phase 1+2: Find suffix, then scan forward for label ---
     for suffix_match in _COMPANY_SUFFIX_RE.finditer(preamble):
         # Word boundary check: "Co" in "Contract" is not a real suffix.
@@ -1176,7 +1412,7 @@ def detect_party_names(text: str) -> list[dict[str, str]]:
         if _is_bare_suffix(name):
             continue
         # Skip matches starting with a common determiner (e.g. "The Company").
-        if _det_re.match(name):
+        if _LEADING_DETERMINER_RE.match(name):
             continue
         # Skip matches starting with "Dear " (letter salutation, not a company).
         if name.startswith("Dear "):
@@ -1185,8 +1421,7 @@ def detect_party_names(text: str) -> list[dict[str, str]]:
         # company.  Skip when the next word is a legal document type.
         if _followed_by_agreement_term(preamble, end_pos):
             continue
-        after = preamble[suffix_match.end():]
-        label_match = _LABEL_AFTER_SUFFIX_RE.match(after)
+        label_match = _LABEL_AFTER_SUFFIX_RE.match(preamble, end_pos)
         if label_match:
             label = label_match.group(1).strip().rstrip(",")
             _add(name, label)
@@ -1209,8 +1444,9 @@ def detect_party_names(text: str) -> list[dict[str, str]]:
     # --- "Dear Name," pattern ---
     for match in _DEAR_RE.finditer(preamble):
         name = match.group(1).strip()
-        if name.lower() not in seen_names:
-            seen_names.add(name.lower())
+        key = name.lower()
+        if key not in seen_names:
+            seen_names.add(key)
             results.append({"name": name, "label": "Addressee"})
 
     return results
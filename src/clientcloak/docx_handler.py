@@ -18,8 +18,11 @@ from __future__ import annotations
 import logging
 import re
 import zipfile
+from bisect import bisect_right
+from collections.abc import Iterator, Mapping
 from copy import deepcopy
 from io import BytesIO
+from itertools import accumulate
 from pathlib import Path
 from typing import TYPE_CHECKING
 from xml.sax.saxutils import escape as _xml_escape, unescape as _xml_unescape
@@ -28,12 +31,16 @@ from docx import Document
 from docx.opc.exceptions import PackageNotFoundError
 from docx.oxml.ns import qn
 
+from .literal_search import AhoCorasickPattern, compile_literals
+
 if TYPE_CHECKING:
     from docx.document import Document as DocumentType
     from docx.table import Table
     from docx.text.paragraph import Paragraph
     from docx.text.run import Run
 
+    from .literal_search import _LiteralMatch
+
 logger = logging.getLogger(__name__)
 
 
@@ -154,29 +161,36 @@ def extract_all_text(doc: Document) -> list[TextSource]:
 
     Empty strings are excluded.
     """
-    results: list[TextSource] = []
+    return list(iter_all_text(doc))
 
+
+def iter_all_text(doc: Document) -> Iterator[TextSource]:
+    """
+    Lazily yield the same ``(text, source_element)`` tuples as
+    :func:`extract_all_text`, in the same order.
+
+    Use this when the fragments are consumed once (e.g. joined into the
+    full document text) so they are never all held in a list at once.
+    """
     # --- body paragraphs ---
     for paragraph in doc.paragraphs:
         text = paragraph.text
-        if text.strip():
-            results.append((text, paragraph))
+        if text and not text.isspace():
+            yield text, paragraph
 
     # --- tables ---
-    results.extend(_extract_from_tables(doc.tables))
+    yield from _iter_table_text(doc.tables)
 
     # --- headers / footers (all sections) ---
     for section in doc.sections:
         for header_footer in _iter_headers_footers(section):
             for paragraph in header_footer.paragraphs:
                 text = paragraph.text
-                if text.strip():
-                    results.append((text, paragraph))
+                if text and not text.isspace():
+                    yield text, paragraph
             # Tables inside headers/footers
             if hasattr(header_footer, "tables"):
-                results.extend(_extract_from_tables(header_footer.tables))
-
-    return results
+                yield from _iter_table_text(header_footer.tables)
 
 
 # ---------------------------------------------------------------------------
@@ -185,9 +199,10 @@ def extract_all_text(doc: Document) -> list[TextSource]:
 
 def replace_text_in_document(
     doc: Document,
-    replacements: dict[str, str],
+    replacements: Mapping[str, str],
     *,
     match_case: bool = True,
+    compiled: CompiledReplacements | None = None,
 ) -> int:
     """
     Apply *replacements* throughout the entire document.
@@ -202,6 +217,9 @@ def replace_text_in_document(
     **uncloaking**, where the mapping stores the exact original text and we
     want to restore it verbatim (e.g. "BigCo LLC", not "Bigco Llc").
 
+    *compiled* may carry the result of :func:`compile_replacements` for
+    *replacements* so a later pass over the same job can reuse it.
+
     Returns the total number of individual replacement operations performed.
 
     The function processes:
@@ -212,16 +230,7 @@ def replace_text_in_document(
     if not replacements:
         return 0
 
-    # Pre-compile a single regex that matches any of the target strings.
-    # Sort longest-first so that "Acme Corporation" is matched before "Acme".
-    sorted_targets = sorted(replacements.keys(), key=len, reverse=True)
-    pattern = re.compile(
-        "|".join(re.escape(t) for t in sorted_targets),
-        flags=re.IGNORECASE,
-    )
-
-    # Build a normalized lookup: lowercased original -> new_text template.
-    lookup: dict[str, str] = {k.lower(): v for k, v in replacements.items()}
+    pattern, lookup = compiled or compile_replacements(replacements)
 
     total = 0
 
@@ -244,6 +253,33 @@ def replace_text_in_document(
     return total
 
 
+# A compiled matcher over the replacement targets plus the lowercased
+# target -> replacement lookup, as returned by compile_replacements.
+CompiledReplacements = tuple[re.Pattern | AhoCorasickPattern, dict[str, str]]
+
+
+def compile_replacements(replacements: Mapping[str, str]) -> CompiledReplacements:
+    """
+    Build the matcher shared by every replacement pass.
+
+    Returns a single case-insensitive matcher over all targets and a
+    normalized lookup of lowercased target -> replacement text, so each
+    text block is scanned once regardless of how many replacements there
+    are.  Targets are matched longest-first so that "Acme Corporation" is
+    matched before "Acme".
+
+    Uses an Aho-Corasick automaton when the ``fast`` extra is installed and
+    an alternation regex otherwise (see :mod:`clientcloak.literal_search`).
+    A pipeline that runs several passes with the same replacements (e.g.
+    the document pass and the ZIP-level XML pass) can build this once and
+    pass it to each as ``compiled``.  Nothing is cached at module level:
+    the targets are the confidential names being cloaked.
+    """
+    pattern = compile_literals(replacements)
+    lookup: dict[str, str] = {k.lower(): v for k, v in replacements.items()}
+    return pattern, lookup
+
+
 # ---------------------------------------------------------------------------
 # Internal: encryption detection
 # ---------------------------------------------------------------------------
@@ -281,20 +317,18 @@ def _is_encrypted(path: Path) -> bool:
 # Internal: text extraction helpers
 # ---------------------------------------------------------------------------
 
-def _extract_from_tables(tables) -> list[TextSource]:
-    """Recursively extract text from tables (handles nested tables)."""
-    results: list[TextSource] = []
+def _iter_table_text(tables) -> Iterator[TextSource]:
+    """Recursively yield text from tables (handles nested tables)."""
     for table in tables:
         for row in table.rows:
             for cell in row.cells:
                 for paragraph in cell.paragraphs:
                     text = paragraph.text
-                    if text.strip():
-                        results.append((text, cell))
+                    if text and not text.isspace():
+                        yield text, cell
                 # Nested tables
                 if cell.tables:
-                    results.extend(_extract_from_tables(cell.tables))
-    return results
+                    yield from _iter_table_text(cell.tables)
 
 
 def _iter_headers_footers(section):
@@ -324,7 +358,7 @@ def _is_bracketed_label(text: str) -> bool:
     during cloaking — applying case transfer would mangle the internal
     capitalisation (e.g. ``[AltCustomerName]`` -> ``[Altcustomername]``).
     """
-    return len(text) >= 2 and text.startswith("[") and text.endswith("]")
+    return len(text) >= 2 and text[0] == "[" and text[-1] == "]"
 
 
 def _transfer_case(original: str, replacement: str) -> str:
@@ -390,7 +424,7 @@ def _transfer_case(original: str, replacement: str) -> str:
 
 def _replace_in_paragraph(
     paragraph: "Paragraph",
-    pattern: re.Pattern,
+    pattern: re.Pattern | AhoCorasickPattern,
     lookup: dict[str, str],
     match_case: bool = True,
 ) -> int:
@@ -405,20 +439,24 @@ def _replace_in_paragraph(
         return 0
 
     # Concatenate run texts to build the full paragraph string.
-    full_text = "".join(r.text for r in runs)
+    run_texts = [r.text for r in runs]
+    full_text = "".join(run_texts)
     if not full_text:
         return 0
 
-    # Quick check: is there anything to replace?
-    if not pattern.search(full_text):
+    # Scan once: the Aho-Corasick backend lowercases the whole block per
+    # call, so the matches are collected here and handed to the splicer
+    # rather than searched for again.
+    matches = list(pattern.finditer(full_text))
+    if not matches:
         return 0
 
-    # Build a mapping: character-index -> (run_index, offset_within_run).
-    char_map = _build_char_map(runs)
+    # Offset of each run's first character in full_text.
+    run_starts = [0, *accumulate(map(len, run_texts))][:-1]
 
     # Try the format-preserving path first.
     try:
-        count = _replace_preserving_format(runs, full_text, char_map, pattern, lookup, match_case)
+        count = _replace_preserving_format(runs, full_text, run_starts, matches, lookup, match_case)
         return count
     except _FallbackNeeded:
         logger.debug(
@@ -432,16 +470,16 @@ class _FallbackNeeded(Exception):
     """Raised internally to trigger the run-collapsing fallback."""
 
 
-def _build_char_map(runs: list["Run"]) -> list[tuple[int, int]]:
+def _locate(run_starts: list[int], pos: int) -> tuple[int, int]:
     """
-    Return a list of length == total characters, where each entry is
-    ``(run_index, offset_within_that_run)``.
+    Return ``(run_index, offset_within_that_run)`` for character *pos* of
+    the paragraph text.
+
+    Empty runs share their start with the following run; ``bisect_right``
+    skips past them to the run that actually holds the character.
     """
-    char_map: list[tuple[int, int]] = []
-    for run_idx, run in enumerate(runs):
-        for offset in range(len(run.text)):
-            char_map.append((run_idx, offset))
-    return char_map
+    run_idx = bisect_right(run_starts, pos) - 1
+    return run_idx, pos - run_starts[run_idx]
 
 
 # ---------------------------------------------------------------------------
@@ -451,24 +489,21 @@ def _build_char_map(runs: list["Run"]) -> list[tuple[int, int]]:
 def _replace_preserving_format(
     runs: list["Run"],
     full_text: str,
-    char_map: list[tuple[int, int]],
-    pattern: re.Pattern,
+    run_starts: list[int],
+    matches: list[re.Match | _LiteralMatch],
     lookup: dict[str, str],
     match_case: bool = True,
 ) -> int:
     """
-    Walk matches from **right to left** (so earlier indices stay valid) and
-    splice replacement characters directly into runs.
+    Walk *matches* (found in *full_text*) from **right to left** (so
+    earlier indices stay valid) and splice replacement characters directly
+    into runs.
 
     If a single match spans runs in a way that makes character-level surgery
     ambiguous (e.g. replacement is shorter/longer than original and the match
     spans 3+ runs with different formatting on interior runs), we raise
     ``_FallbackNeeded`` so the caller can try the simpler strategy.
     """
-    matches = list(pattern.finditer(full_text))
-    if not matches:
-        return 0
-
     # Process right-to-left to keep positional indices stable.
     for match in reversed(matches):
         matched_text = match.group()
@@ -480,16 +515,15 @@ def _replace_preserving_format(
 
         start, end = match.start(), match.end()
         match_len = end - start
-        repl_len = len(new_text)
 
         # Identify which runs are touched.
-        # Guard against stale char_map after earlier in-place splices
-        # shifted run lengths (right-to-left processing mitigates this,
-        # but pandoc-converted docs can still trigger edge cases).
-        if start >= len(char_map) or (end - 1) >= len(char_map):
+        # Guard against offsets past the end of the paragraph text
+        # (right-to-left processing keeps them valid, but pandoc-converted
+        # docs can still trigger edge cases).
+        if end > len(full_text):
             raise _FallbackNeeded
-        first_run_idx, first_offset = char_map[start]
-        last_run_idx, _ = char_map[end - 1]
+        first_run_idx, first_offset = _locate(run_starts, start)
+        last_run_idx, last_offset = _locate(run_starts, end - 1)
 
         span_count = last_run_idx - first_run_idx + 1
 
@@ -499,15 +533,15 @@ def _replace_preserving_format(
 
         elif span_count == 2:
             # Match spans exactly two runs.
-            _splice_two_runs(runs, first_run_idx, last_run_idx, char_map,
-                             start, end, new_text)
+            _splice_two_runs(runs, first_run_idx, last_run_idx,
+                             first_offset, last_offset, new_text)
 
         else:
             # Match spans 3+ runs. Attempt: put replacement in the first run,
             # clear the spanned portions in the middle runs, clear the portion
             # in the last run. If middle runs become empty that is fine.
-            _splice_multi_runs(runs, first_run_idx, last_run_idx, char_map,
-                               start, end, new_text)
+            _splice_multi_runs(runs, first_run_idx, last_run_idx,
+                               first_offset, last_offset, new_text)
 
     return len(matches)
 
@@ -522,9 +556,8 @@ def _splice_two_runs(
     runs: list["Run"],
     first_idx: int,
     last_idx: int,
-    char_map: list[tuple[int, int]],
-    match_start: int,
-    match_end: int,
+    first_offset: int,
+    last_offset: int,
     new_text: str,
 ) -> None:
     """
@@ -532,14 +565,13 @@ def _splice_two_runs(
 
     Strategy: put the full replacement into the tail of the first run
     (starting where the match begins inside that run) and remove the matched
-    portion from the second run.
+    portion from the second run.  *first_offset* is the match start inside
+    the first run and *last_offset* the last matched character inside the
+    second.
     """
     first_run = runs[first_idx]
     last_run = runs[last_idx]
 
-    _, first_offset = char_map[match_start]
-    _, last_offset = char_map[match_end - 1]
-
     # First run: keep everything before the match start, append new_text.
     first_run.text = first_run.text[:first_offset] + new_text
 
@@ -551,9 +583,8 @@ def _splice_multi_runs(
     runs: list["Run"],
     first_idx: int,
     last_idx: int,
-    char_map: list[tuple[int, int]],
-    match_start: int,
-    match_end: int,
+    first_offset: int,
+    last_offset: int,
     new_text: str,
 ) -> None:
     """
@@ -565,9 +596,6 @@ def _splice_multi_runs(
     first_run = runs[first_idx]
     last_run = runs[last_idx]
 
-    _, first_offset = char_map[match_start]
-    _, last_offset = char_map[match_end - 1]
-
     # First run: keep text before match, append replacement.
     first_run.text = first_run.text[:first_offset] + new_text
 
@@ -586,7 +614,7 @@ def _splice_multi_runs(
 def _replace_collapsing_runs(
     paragraph: "Paragraph",
     full_text: str,
-    pattern: re.Pattern,
+    pattern: re.Pattern | AhoCorasickPattern,
     lookup: dict[str, str],
     match_case: bool = True,
 ) -> int:
@@ -641,7 +669,7 @@ def _replace_collapsing_runs(
 
 def _replace_in_tables(
     tables,
-    pattern: re.Pattern,
+    pattern: re.Pattern | AhoCorasickPattern,
     lookup: dict[str, str],
     match_case: bool = True,
 ) -> int:
@@ -664,9 +692,10 @@ def _replace_in_tables(
 
 def replace_text_in_xml(
     docx_path: str | Path,
-    replacements: dict[str, str],
+    replacements: Mapping[str, str],
     *,
     match_case: bool = True,
+    compiled: CompiledReplacements | None = None,
 ) -> int:
     """
     Apply text replacements directly in the .docx XML.
@@ -685,6 +714,8 @@ def replace_text_in_xml(
         docx_path: Path to the saved .docx file.
         replacements: Mapping of ``search_text -> replacement_text``.
         match_case: If True, apply case transfer to replacement text.
+        compiled: The result of :func:`compile_replacements` for
+            *replacements*, if the caller already built it.
 
     Returns:
         The number of individual text substitutions made.
@@ -693,13 +724,36 @@ def replace_text_in_xml(
         return 0
 
     docx_path = Path(docx_path)
-
-    sorted_targets = sorted(replacements.keys(), key=len, reverse=True)
-    pattern = re.compile(
-        "|".join(re.escape(t) for t in sorted_targets),
-        flags=re.IGNORECASE,
+    output_bytes, total = replace_text_in_xml_bytes(
+        docx_path.read_bytes(), replacements, match_case=match_case, compiled=compiled,
     )
-    lookup: dict[str, str] = {k.lower(): v for k, v in replacements.items()}
+    docx_path.write_bytes(output_bytes)
+    return total
+
+
+# A ``<w:t>`` element in raw part XML: opening tag, text, closing tag.
+_WT_ELEMENT_RE = re.compile(r"(<w:t(?:\s[^>]*)?>)(.*?)(</w:t>)", re.DOTALL)
+
+
+def replace_text_in_xml_bytes(
+    docx_bytes: bytes,
+    replacements: Mapping[str, str],
+    *,
+    match_case: bool = True,
+    compiled: CompiledReplacements | None = None,
+) -> tuple[bytes, int]:
+    """
+    In-memory variant of :func:`replace_text_in_xml`.
+
+    Takes the raw bytes of a .docx archive and returns a 2-tuple of the
+    rewritten archive bytes and the number of substitutions made.  Lets
+    callers chain several ZIP-level passes without touching the disk in
+    between.
+    """
+    if not replacements:
+        return docx_bytes, 0
+
+    pattern, lookup = compiled or compile_replacements(replacements)
 
     # XML parts that may contain document text.
     text_parts = {
@@ -708,46 +762,39 @@ def replace_text_in_xml(
         "word/endnotes.xml",
     }
 
-    input_bytes = docx_path.read_bytes()
     buf = BytesIO()
     total = 0
 
-    with zipfile.ZipFile(BytesIO(input_bytes), "r") as zin, \
+    def _sub(sm: re.Match) -> str:
+        nonlocal total
+        total += 1
+        matched = sm.group()
+        template = lookup[matched.lower()]
+        if match_case and not _is_bracketed_label(template):
+            return _transfer_case(matched, template)
+        return template
+
+    def _replace_in_wt(m: re.Match) -> str:
+        # Most <w:t> elements contain no target: leave them byte-for-byte
+        # as they are instead of unescaping and re-escaping their text.
+        before = total
+        new_text = pattern.sub(_sub, _xml_unescape(m.group(2)))
+        if total == before:
+            return m.group()
+        return m.group(1) + _xml_escape(new_text) + m.group(3)
+
+    with zipfile.ZipFile(BytesIO(docx_bytes), "r") as zin, \
          zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zout:
         for item in zin.infolist():
             raw = zin.read(item.filename)
             if item.filename in text_parts or item.filename.startswith("word/header") \
                     or item.filename.startswith("word/footer"):
                 xml_str = raw.decode("utf-8")
-
-                def _replace_in_wt(m: re.Match) -> str:
-                    nonlocal total
-                    tag_open = m.group(1)
-                    text_content = m.group(2)
-                    tag_close = m.group(3)
-                    plain_text = _xml_unescape(text_content)
-
-                    def _sub(sm: re.Match) -> str:
-                        nonlocal total
-                        total += 1
-                        matched = sm.group()
-                        template = lookup[matched.lower()]
-                        if match_case and not _is_bracketed_label(template):
-                            return _transfer_case(matched, template)
-                        return template
-
-                    new_text = pattern.sub(_sub, plain_text)
-                    return tag_open + _xml_escape(new_text) + tag_close
-
-                xml_str = re.sub(
-                    r"(<w:t(?:\s[^>]*)?>)(.*?)(</w:t>)",
-                    _replace_in_wt,
-                    xml_str,
-                    flags=re.DOTALL,
-                )
-                raw = xml_str.encode("utf-8")
+                before = total
+                xml_str = _WT_ELEMENT_RE.sub(_replace_in_wt, xml_str)
+                if total != before:
+                    raw = xml_str.encode("utf-8")
             zout.writestr(item, raw)
 
-    docx_path.write_bytes(buf.getvalue())
     logger.info("XML-level replacements applied: %d", total)
-    return total
+    return buf.getvalue(), total
@@ -0,0 +1,124 @@
+"""
+Multi-literal search for ClientCloak's replacement passes.
+
+Every replacement pass (comment bodies, document runs, ZIP-level XML) has to
+find many literal target strings -- case-insensitively and longest-first --
+in many small blocks of text.  The default backend is a single alternation
+regex.  When the optional ``pyahocorasick`` package is installed, an
+Aho-Corasick automaton is used instead: it scans each text block once no
+matter how many targets there are, whereas the regex engine retries every
+alternative at every position.
+
+Both backends expose the subset of the :class:`re.Pattern` API the callers
+rely on (``search``, ``finditer``, ``sub``), so they are interchangeable.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable, Iterator
+
+try:
+    import ahocorasick  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on the environment
+    ahocorasick = None
+
+
+def compile_literals(targets: Iterable[str]) -> re.Pattern | AhoCorasickPattern:
+    """
+    Compile *targets* into a case-insensitive, longest-first matcher.
+
+    At each position the longest target wins, so "Acme Corporation" is
+    matched before "Acme", and matches never overlap.
+
+    Args:
+        targets: The literal strings to search for.  Empty strings are
+            ignored.
+
+    Returns:
+        An :class:`AhoCorasickPattern` when ``pyahocorasick`` is installed,
+        otherwise a compiled alternation :class:`re.Pattern`.
+    """
+    # Ties are broken alphabetically so the pattern does not depend on the
+    # iteration order of *targets*.
+    sorted_targets = sorted({t for t in targets if t}, key=lambda t: (-len(t), t))
+    regex = re.compile(
+        "|".join(re.escape(t) for t in sorted_targets),
+        flags=re.IGNORECASE,
+    )
+    if ahocorasick is None or not sorted_targets:
+        return regex
+    return AhoCorasickPattern(sorted_targets, regex)
+
+
+class _LiteralMatch:
+    """Minimal stand-in for :class:`re.Match` returned by AhoCorasickPattern."""
+
+    __slots__ = ("_string", "_start", "_end")
+
+    def __init__(self, string: str, start: int, end: int) -> None:
+        self._string = string
+        self._start = start
+        self._end = end
+
+    def start(self) -> int:
+        return self._start
+
+    def end(self) -> int:
+        return self._end
+
+    def group(self) -> str:
+        return self._string[self._start:self._end]
+
+
+class AhoCorasickPattern:
+    """
+    Aho-Corasick automaton with an ``re.Pattern``-compatible interface.
+
+    Matching is done on the lowercased text.  If lowercasing changes the
+    length of a text block (possible for a handful of non-ASCII characters),
+    offsets would no longer line up with the original, so that block is
+    handed to the equivalent regex instead.
+    """
+
+    def __init__(self, targets: list[str], fallback: re.Pattern) -> None:
+        self._fallback = fallback
+        self._automaton = ahocorasick.Automaton()
+        for target in targets:
+            key = target.lower()
+            self._automaton.add_word(key, len(key))
+        self._automaton.make_automaton()
+
+    def finditer(self, string: str) -> Iterator[_LiteralMatch | re.Match]:
+        lowered = string.lower()
+        if len(lowered) != len(string):
+            yield from self._fallback.finditer(string)
+            return
+
+        # The automaton reports every hit (including overlapping and nested
+        # ones); keep the leftmost-longest, non-overlapping subset to mirror
+        # the regex backend.
+        spans = sorted(
+            ((end - length + 1, end + 1) for end, length in self._automaton.iter(lowered)),
+            key=lambda span: (span[0], -span[1]),
+        )
+        last_end = 0
+        for start, end in spans:
+            if start >= last_end:
+                yield _LiteralMatch(string, start, end)
+                last_end = end
+
+    def search(self, string: str) -> _LiteralMatch | re.Match | None:
+        return next(self.finditer(string), None)
+
+    def sub(self, repl: Callable[[_LiteralMatch | re.Match], str], string: str) -> str:
+        pieces: list[str] = []
+        pos = 0
+        for match in self.finditer(string):
+            pieces.append(string[pos:match.start()])
+            pieces.append(repl(match))
+            pos = match.end()
+        if not pieces:
+            return string
+        pieces.append(string[pos:])
+        return "".join(pieces)
@@ -77,7 +77,9 @@ def load_mapping(file_path: str | Path) -> MappingFile:
             schema.
     """
     path = Path(file_path)
-    raw = path.read_text(encoding="utf-8")
+    # Hand the raw bytes straight to pydantic-core's JSON parser rather than
+    # decoding to str first (or going through the stdlib json module).
+    raw = path.read_bytes()
     return MappingFile.model_validate_json(raw)
 
 
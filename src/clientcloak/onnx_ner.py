@@ -21,6 +21,7 @@ from __future__ import annotations
 import json
 import logging
 import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -31,6 +32,9 @@ logger = logging.getLogger(__name__)
 # Same word-splitting regex used by GLiNER's WhitespaceTokenSplitter.
 _WORD_RE = re.compile(r"\w+(?:[-_]\w+)*|\S")
 
+# Maximum number of texts padded into one session.run call.
+_BATCH_SIZE = 8
+
 
 class OnnxNerModel:
     """Drop-in replacement for ``GLiNER`` that uses ONNX Runtime."""
@@ -53,7 +57,12 @@ class OnnxNerModel:
         self._sep_token = sep_token
 
         # Cache ONNX I/O names for validation.
-        self._input_names = {inp.name for inp in session.get_inputs()}
+        inputs = session.get_inputs()
+        self._input_names = {inp.name for inp in inputs}
+        # A graph exported with a fixed batch size reports an int for the
+        # first dimension; dynamic axes are reported as a name or None.
+        batch_dim = getattr(inputs[0], "shape", [None])[0] if inputs else None
+        self._dynamic_batch = not isinstance(batch_dim, int)
 
     # ------------------------------------------------------------------
     # Public API — matches GLiNER.predict_entities()
@@ -73,65 +82,136 @@ class OnnxNerModel:
             [{"start": 0, "end": 10, "text": "John Smith",
               "label": "person", "score": 0.92}, ...]
         """
-        # 1. Word-split the raw text.
-        words, starts, ends = _split_words(text)
-        if not words:
-            return []
+        return self.batch_predict_entities(
+            [text], labels, threshold=threshold, flat_ner=flat_ner,
+        )[0]
 
-        num_words = min(len(words), self._max_len)
-        words = words[:num_words]
-        starts = starts[:num_words]
-        ends = ends[:num_words]
+    def batch_predict_entities(
+        self,
+        texts: list[str],
+        labels: list[str],
+        threshold: float = 0.5,
+        flat_ner: bool = True,
+    ) -> list[list[dict[str, Any]]]:
+        """Detect named entities in each of *texts*.
 
-        # 2. Build the entity-label prompt.
+        Up to :data:`_BATCH_SIZE` texts are padded into a single
+        ``session.run`` call when the graph has a dynamic batch axis;
+        otherwise each text is run on its own.  Returns one
+        :meth:`predict_entities`-style list per input text.
+        """
+        # 1. Build the entity-label prompt.
         labels = list(dict.fromkeys(labels))  # dedupe, preserve order
         prompt: list[str] = []
         for label in labels:
             prompt.append(self._ent_token)
             prompt.append(label)
         prompt.append(self._sep_token)
-        prompt_len = len(prompt)
 
-        # 3. Merge prompt + text words and tokenize.
-        all_words = prompt + words
-        encoding = self._tokenizer.encode(all_words, is_pretokenized=True)
-        input_ids = encoding.ids
-        attention_mask = encoding.attention_mask
-        word_ids_list = encoding.word_ids  # None for special tokens
+        results: list[list[dict[str, Any]]] = [[] for _ in texts]
+        pending: list[_PreparedText] = []
+        for index, text in enumerate(texts):
+            prepared = self._prepare(index, text, prompt)
+            if prepared is not None:
+                pending.append(prepared)
+
+        batch_size = _BATCH_SIZE if self._dynamic_batch else 1
+        for i in range(0, len(pending), batch_size):
+            batch = pending[i:i + batch_size]
+            (logits,) = self._session.run(["logits"], self._build_feed(batch))
+            # logits shape: (batch, max_words, max_width, num_classes)
+            for row, prepared in zip(logits, batch):
+                results[prepared.index] = self._decode(
+                    row, prepared, labels, threshold, flat_ner,
+                )
+
+        return results
+
+    # ------------------------------------------------------------------
+    # Inference steps
+    # ------------------------------------------------------------------
+
+    def _prepare(
+        self, index: int, text: str, prompt: list[str],
+    ) -> _PreparedText | None:
+        """Word-split and tokenize *text*; None when it has no words."""
+        # Word-split the raw text.
+        words, starts, ends = _split_words(text)
+        if not words:
+            return None
 
-        seq_len = len(input_ids)
+        num_words = min(len(words), self._max_len)
+        words = words[:num_words]
 
-        # 4. Build words_mask (1-indexed text-word positions; 0 for prompt/special).
-        words_mask = _build_words_mask(word_ids_list, prompt_len)
+        # Merge prompt + text words and tokenize.
+        encoding = self._tokenizer.encode(prompt + words, is_pretokenized=True)
+
+        return _PreparedText(
+            index=index,
+            text=text,
+            starts=starts[:num_words],
+            ends=ends[:num_words],
+            input_ids=encoding.ids,
+            attention_mask=encoding.attention_mask,
+            # 1-indexed text-word positions; 0 for prompt/special tokens.
+            words_mask=_build_words_mask(encoding.word_ids, len(prompt)),
+        )
 
-        # 5. Build span_idx and span_mask.
-        span_idx, span_mask = _build_spans(num_words, self._max_width)
+    def _build_feed(self, batch: list[_PreparedText]) -> dict[str, np.ndarray]:
+        """Pad *batch* to a common length and assemble the ONNX inputs."""
+        seq_len = max(len(p.input_ids) for p in batch)
+        max_words = max(len(p.starts) for p in batch)
+        num_spans = max_words * self._max_width
+
+        input_ids = np.zeros((len(batch), seq_len), dtype=np.int64)
+        attention_mask = np.zeros((len(batch), seq_len), dtype=np.int64)
+        words_mask = np.zeros((len(batch), seq_len), dtype=np.int64)
+        text_lengths = np.zeros((len(batch), 1), dtype=np.int64)
+        span_idx = np.zeros((len(batch), num_spans, 2), dtype=np.int64)
+        span_mask = np.zeros((len(batch), num_spans), dtype=np.bool_)
+
+        for row, prepared in enumerate(batch):
+            n_tokens = len(prepared.input_ids)
+            num_words = len(prepared.starts)
+            input_ids[row, :n_tokens] = prepared.input_ids
+            attention_mask[row, :n_tokens] = prepared.attention_mask
+            words_mask[row, :n_tokens] = prepared.words_mask
+            text_lengths[row, 0] = num_words
+            spans, mask = _build_spans(num_words, self._max_width)
+            span_idx[row, :len(spans)] = spans
+            span_mask[row, :len(mask)] = mask
 
-        # 6. Assemble numpy inputs (batch size 1).
         feed: dict[str, np.ndarray] = {
-            "input_ids": np.array([input_ids], dtype=np.int64),
-            "attention_mask": np.array([attention_mask], dtype=np.int64),
-            "words_mask": np.array([words_mask], dtype=np.int64),
-            "text_lengths": np.array([[num_words]], dtype=np.int64),
-            "span_idx": np.array([span_idx], dtype=np.int64),
-            "span_mask": np.array([span_mask], dtype=np.bool_),
+            "input_ids": input_ids,
+            "attention_mask": attention_mask,
+            "words_mask": words_mask,
+            "text_lengths": text_lengths,
+            "span_idx": span_idx,
+            "span_mask": span_mask,
         }
         # Filter to only inputs the ONNX graph expects.
-        feed = {k: v for k, v in feed.items() if k in self._input_names}
+        return {k: v for k, v in feed.items() if k in self._input_names}
 
-        # 7. Run ONNX inference → logits.
-        (logits,) = self._session.run(["logits"], feed)
-        # logits shape: (1, num_words, max_width, num_classes)
+    def _decode(
+        self,
+        logits: np.ndarray,
+        prepared: _PreparedText,
+        labels: list[str],
+        threshold: float,
+        flat_ner: bool,
+    ) -> list[dict[str, Any]]:
+        """Turn one text's logits into GLiNER-style entity dicts."""
+        starts, ends = prepared.starts, prepared.ends
 
-        # 8. Decode spans.
-        num_classes = len(labels)
+        # Decode spans.  Padded word positions can only form spans that end
+        # past ``num_words`` and are rejected by _decode_logits.
         id_to_class = {i: label for i, label in enumerate(labels)}
         raw_spans = _decode_logits(
-            logits[0], num_words, self._max_width, num_classes,
+            logits, len(starts), self._max_width, len(labels),
             id_to_class, threshold, flat_ner,
         )
 
-        # 9. Map token indices → character offsets.
+        # Map token indices → character offsets.
         entities: list[dict[str, Any]] = []
         for start_tok, end_tok, ent_type, score in raw_spans:
             if start_tok >= len(starts) or end_tok >= len(ends):
@@ -141,7 +221,7 @@ class OnnxNerModel:
             entities.append({
                 "start": start_char,
                 "end": end_char,
-                "text": text[start_char:end_char],
+                "text": prepared.text[start_char:end_char],
                 "label": ent_type,
                 "score": float(score),
             })
@@ -149,6 +229,18 @@ class OnnxNerModel:
         return entities
 
 
+@dataclass
+class _PreparedText:
+    """Tokenized model inputs for one text, before padding into a batch."""
+    index: int
+    text: str
+    starts: list[int]
+    ends: list[int]
+    input_ids: list[int]
+    attention_mask: list[int]
+    words_mask: list[int]
+
+
 # ------------------------------------------------------------------
 # Internal helpers
 # ------------------------------------------------------------------
@@ -668,6 +668,12 @@ def _remove_metadata_finding(doc: Document, finding: SecurityFinding) -> bool:
     return False
 
 
+# Location strings produced by the scanners above.
+_PARAGRAPH_LOCATION_RE = re.compile(r"Paragraph (\d+)")
+_TABLE_CELL_LOCATION_RE = re.compile(r"Table (\d+), Row (\d+), Cell (\d+)")
+_SECTION_LOCATION_RE = re.compile(r"Section (\d+) (.+)")
+
+
 def _remove_content_finding(doc: Document, finding: SecurityFinding) -> bool:
     """
     Remove or neutralise content from the document body based on a finding's
@@ -676,7 +682,7 @@ def _remove_content_finding(doc: Document, finding: SecurityFinding) -> bool:
     location = finding.location
 
     # --- Paragraph-level findings ---
-    para_match = re.match(r"Paragraph (\d+)", location)
+    para_match = _PARAGRAPH_LOCATION_RE.match(location)
     if para_match:
         para_idx = int(para_match.group(1)) - 1
         if 0 <= para_idx < len(doc.paragraphs):
@@ -684,9 +690,7 @@ def _remove_content_finding(doc: Document, finding: SecurityFinding) -> bool:
         return False
 
     # --- Table cell findings ---
-    table_match = re.match(
-        r"Table (\d+), Row (\d+), Cell (\d+)", location
-    )
+    table_match = _TABLE_CELL_LOCATION_RE.match(location)
     if table_match:
         t_idx = int(table_match.group(1)) - 1
         r_idx = int(table_match.group(2)) - 1
@@ -702,7 +706,7 @@ def _remove_content_finding(doc: Document, finding: SecurityFinding) -> bool:
             return False
 
     # --- Header / footer findings ---
-    section_match = re.match(r"Section (\d+) (.+)", location)
+    section_match = _SECTION_LOCATION_RE.match(location)
     if section_match:
         sec_idx = int(section_match.group(1)) - 1
         hf_label = section_match.group(2)
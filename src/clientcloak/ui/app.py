@@ -7,6 +7,7 @@ that wires up routes, static files, templates, and startup hooks.
 
 from __future__ import annotations
 
+import os
 import sys
 import threading
 import webbrowser
@@ -25,6 +26,7 @@ from starlette.middleware.cors import CORSMiddleware
 from starlette.responses import Response
 
 from .. import __version__
+from ..detector import preload_gliner_model
 from ..sessions import cleanup_expired_sessions
 from .routes.cloak import router as cloak_router
 from .routes.uncloak import router as uncloak_router
@@ -72,6 +74,10 @@ async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
     removed = cleanup_expired_sessions()
     if removed:
         logger.info("Cleaned up expired sessions", count=removed)
+    if os.environ.get("CLIENTCLOAK_EAGER_GLINER"):
+        # Load the NER model in the background so the first upload does
+        # not wait for it.
+        preload_gliner_model()
     logger.info("ClientCloak web server started")
     yield
 
@@ -12,14 +12,17 @@ reversed so that anonymous reviewer labels are restored to real names.
 from __future__ import annotations
 
 import logging
+from collections import ChainMap
+from collections.abc import Mapping
+from io import BytesIO
 from pathlib import Path
 
-from .comments import restore_comment_authors
+from .comments import restore_comment_authors_bytes
 from .docx_handler import (
+    compile_replacements,
     load_document,
     replace_text_in_document,
-    replace_text_in_xml,
-    save_document,
+    replace_text_in_xml_bytes,
 )
 from .mapping import load_mapping
 
@@ -42,7 +45,8 @@ def uncloak_document(
            needed for uncloaking. Comment author labels are included as
            additional replacements.
         4. Apply all replacements throughout the document.
-        5. Save the uncloaked document.
+        5. Serialize the document in memory, apply the ZIP-level passes
+           (tracked changes, comment authors), and write the result once.
 
     Args:
         input_path: Path to the cloaked .docx file to restore.
@@ -73,36 +77,49 @@ def uncloak_document(
         len(mapping.comment_authors),
     )
 
-    # --- 3. Build replacements dict (placeholder -> original) ---
-    # The mapping file already stores this in the correct direction.
-    replacements: dict[str, str] = dict(mapping.mappings)
-
-    # Include comment author labels -> original author names.
-    # These are stored as anonymous_label -> original_author in the mapping.
+    # --- 3. Build replacements (placeholder -> original) ---
+    # The mapping file already stores this in the correct direction, so use
+    # it as-is rather than copying it.  Comment author labels (stored as
+    # anonymous_label -> original_author) are layered on top with a
+    # ChainMap; they come first so they win on key collisions.
+    replacements: Mapping[str, str] = mapping.mappings
     if mapping.comment_authors:
-        replacements.update(mapping.comment_authors)
+        replacements = ChainMap(mapping.comment_authors, mapping.mappings)
 
     # --- 4. Apply replacements ---
     # Use match_case=False so originals are restored verbatim (e.g.
     # "BigCo LLC" not "Bigco Llc" from title-case "Licensee").
-    replacement_count = replace_text_in_document(doc, replacements, match_case=False)
+    # The document pass and the XML pass below share one compiled matcher.
+    compiled = compile_replacements(replacements)
+    replacement_count = replace_text_in_document(
+        doc, replacements, match_case=False, compiled=compiled,
+    )
     logger.info("Applied %d uncloak replacement(s).", replacement_count)
 
-    # --- 5. Save ---
-    save_document(doc, output_path)
+    # --- 5. Serialize in memory ---
+    # The ZIP-level passes below operate on the archive bytes directly, so
+    # the output file is written exactly once instead of being saved,
+    # re-read, and rewritten for each pass.
+    buf = BytesIO()
+    doc.save(buf)
+    output_bytes = buf.getvalue()
 
     # --- 5b. Replace text in tracked changes (XML-level) ---
     # python-docx doesn't expose runs inside <w:ins>/<w:del> elements.
     # This catches placeholders in tracked changes, text boxes, footnotes.
-    xml_count = replace_text_in_xml(output_path, replacements, match_case=False)
+    output_bytes, xml_count = replace_text_in_xml_bytes(
+        output_bytes, replacements, match_case=False, compiled=compiled,
+    )
     if xml_count:
         logger.info("Applied %d XML-level replacement(s) (tracked changes, etc.).", xml_count)
 
     # --- 6. Restore comment authors ---
     if mapping.comment_authors:
-        restore_comment_authors(output_path, output_path, mapping.comment_authors)
+        output_bytes = restore_comment_authors_bytes(output_bytes, mapping.comment_authors)
         logger.info("Restored %d comment author(s).", len(mapping.comment_authors))
 
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(output_bytes)
     logger.info("Uncloaked document saved to %s.", output_path)
 
     return replacement_count
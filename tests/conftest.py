@@ -6,6 +6,7 @@ with known content, tables, headers, footers, and comments.
 """
 
 import json
+import shutil
 import zipfile
 from io import BytesIO
 from pathlib import Path
@@ -29,6 +30,12 @@ SAMPLE_MAPPING = FIXTURES_DIR / "sample_contract_mapping.json"
 # Helpers: create .docx files with known content
 # ---------------------------------------------------------------------------
 
+# Fixture archives are throwaway, so spend as little CPU as possible
+# compressing them.  Tiny parts such as comments.xml are stored as-is.
+_FIXTURE_COMPRESSLEVEL = 1
+_FIXTURE_SMALL_PART_COMPRESSION = zipfile.ZIP_STORED
+
+
 def make_simple_docx(path: Path, paragraphs: list[str]) -> Path:
     """Create a .docx with the given paragraph texts."""
     doc = Document()
@@ -57,20 +64,30 @@ def make_docx_with_comments(path: Path, body_text: str, comments: list[dict]) ->
 
     Each comment dict should have keys: author, initials, date, text.
     """
-    # First create a basic docx
+    # Build the basic docx in memory so the comments part can be appended
+    # before anything touches the disk.
     doc = Document()
     doc.add_paragraph(body_text)
-    doc.save(str(path))
+    buf = BytesIO()
+    doc.save(buf)
 
-    # Now inject comments.xml into the ZIP
+    # Now inject comments.xml into the ZIP.  The python-docx default
+    # template has no comments part, so append mode can add it without
+    # rewriting the other entries.
     if comments:
-        _inject_comments_xml(path, comments)
+        with zipfile.ZipFile(buf, "a") as zf:
+            zf.writestr(
+                "word/comments.xml",
+                _build_comments_xml(comments),
+                compress_type=_FIXTURE_SMALL_PART_COMPRESSION,
+            )
 
+    path.write_bytes(buf.getvalue())
     return path
 
 
-def _inject_comments_xml(path: Path, comments: list[dict]) -> None:
-    """Inject a word/comments.xml entry into an existing .docx ZIP."""
+def _build_comments_xml(comments: list[dict]) -> bytes:
+    """Serialize a word/comments.xml part for the given comment dicts."""
     ns_w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
     ET.register_namespace("w", ns_w)
 
@@ -87,20 +104,7 @@ def _inject_comments_xml(path: Path, comments: list[dict]) -> None:
         t_el = ET.SubElement(r_el, f"{{{ns_w}}}t")
         t_el.text = c["text"]
 
-    comments_xml = ET.tostring(root, encoding="UTF-8", xml_declaration=True)
-
-    # Re-write the ZIP with the new comments.xml
-    original = path.read_bytes()
-    buf = BytesIO()
-    with zipfile.ZipFile(BytesIO(original), "r") as zin, \
-         zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zout:
-        for item in zin.infolist():
-            if item.filename == "word/comments.xml":
-                continue
-            zout.writestr(item, zin.read(item.filename))
-        zout.writestr("word/comments.xml", comments_xml)
-
-    path.write_bytes(buf.getvalue())
+    return ET.tostring(root, encoding="UTF-8", xml_declaration=True)
 
 
 def make_docx_with_tracked_insertion(
@@ -109,15 +113,16 @@ def make_docx_with_tracked_insertion(
     """Create a .docx with body text and a tracked insertion (w:ins) paragraph."""
     doc = Document()
     doc.add_paragraph(body_text)
-    doc.save(str(path))
+    src = BytesIO()
+    doc.save(src)
 
     # Inject a <w:ins> element via ZIP manipulation (python-docx doesn't
-    # support creating tracked changes).
+    # support creating tracked changes).  Done in memory so the final file
+    # is written exactly once.
     ns_w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-    original = path.read_bytes()
     buf = BytesIO()
-    with zipfile.ZipFile(BytesIO(original), "r") as zin, \
-         zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zout:
+    with zipfile.ZipFile(src, "r") as zin, \
+         zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED, compresslevel=_FIXTURE_COMPRESSLEVEL) as zout:
         for item in zin.infolist():
             raw = zin.read(item.filename)
             if item.filename == "word/document.xml":
@@ -131,7 +136,9 @@ def make_docx_with_tracked_insertion(
                 )
                 xml_str = xml_str.replace("</w:body>", ins_xml + "</w:body>")
                 raw = xml_str.encode("utf-8")
-            zout.writestr(item, raw)
+            # The level must be passed per entry: writestr() ignores the
+            # archive-wide compresslevel when given an existing ZipInfo.
+            zout.writestr(item, raw, compresslevel=_FIXTURE_COMPRESSLEVEL)
     path.write_bytes(buf.getvalue())
     return path
 
@@ -173,11 +180,15 @@ def make_docx_with_white_text(path: Path, normal_text: str, white_text: str) ->
 # Pytest fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-def simple_docx(tmp_path):
-    """A simple .docx with known text for replacement tests."""
+# The helper-built documents below are expensive to produce through
+# python-docx but never change, so each is built once per session and copied
+# into the test's own tmp_path.  A copy (rather than a hard link) keeps the
+# shared source safe from tests that rewrite their input in place.
+
+@pytest.fixture(scope="session")
+def _simple_docx_src(tmp_path_factory):
     return make_simple_docx(
-        tmp_path / "simple.docx",
+        tmp_path_factory.mktemp("fixtures") / "simple.docx",
         [
             "This agreement is between Acme Corporation and BigCo LLC.",
             "Acme Corporation shall provide services to BigCo LLC.",
@@ -186,11 +197,10 @@ def simple_docx(tmp_path):
     )
 
 
-@pytest.fixture
-def table_docx(tmp_path):
-    """A .docx with a table containing party names."""
+@pytest.fixture(scope="session")
+def _table_docx_src(tmp_path_factory):
     return make_table_docx(
-        tmp_path / "table.docx",
+        tmp_path_factory.mktemp("fixtures") / "table.docx",
         [
             ["Party", "Role"],
             ["Acme Corporation", "Vendor"],
@@ -199,6 +209,18 @@ def table_docx(tmp_path):
     )
 
 
+@pytest.fixture
+def simple_docx(tmp_path, _simple_docx_src):
+    """A simple .docx with known text for replacement tests."""
+    return Path(shutil.copyfile(_simple_docx_src, tmp_path / "simple.docx"))
+
+
+@pytest.fixture
+def table_docx(tmp_path, _table_docx_src):
+    """A .docx with a table containing party names."""
+    return Path(shutil.copyfile(_table_docx_src, tmp_path / "table.docx"))
+
+
 @pytest.fixture
 def sample_contract():
     """Path to the pre-existing sample_contract.docx fixture."""
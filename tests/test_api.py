@@ -18,47 +18,83 @@ from fastapi.testclient import TestClient
 
 from clientcloak.ui.app import create_app
 
-
-def _parse_upload_ndjson(resp):
-    """Parse an NDJSON streaming upload response, returning the final data dict."""
-    lines = resp.text.strip().split("\n")
-    for line in reversed(lines):
-        event = json.loads(line)
-        if event.get("stage") == "complete":
-            return event["data"]
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+
+def _upload(client, docx_path, filename="test.docx"):
+    """Upload *docx_path* and return the data dict of the final NDJSON event.
+
+    The response is streamed line by line and reading stops as soon as the
+    ``complete`` event arrives, so the body is never buffered as a whole.
+    """
+    with open(docx_path, "rb") as f, \
+         client.stream("POST", "/api/upload", files={"file": (filename, f)}) as resp:
+        assert resp.status_code == 200
+        for line in resp.iter_lines():
+            if not line:
+                continue
+            event = _json_loads(line)
+            if event.get("stage") == "complete":
+                return event["data"]
     raise ValueError("No 'complete' event in upload response")
 
 
-@pytest.fixture()
-def client(tmp_path, monkeypatch):
-    """Create a TestClient with a temporary session directory."""
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    """Create a TestClient with a temporary session directory.
+
+    Module-scoped so that fixtures like :func:`cloaked_session` can share a
+    single upload across tests.  Every upload creates its own session, so
+    tests stay independent of one another.
+    """
     # Point sessions to a temp directory so tests don't pollute real data.
-    monkeypatch.setenv("CLIENTCLOAK_SESSIONS_DIR", str(tmp_path / "sessions"))
-    app = create_app()
-    return TestClient(app)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("CLIENTCLOAK_SESSIONS_DIR", str(tmp_path_factory.mktemp("sessions")))
+        app = create_app()
+        yield TestClient(app)
 
 
-@pytest.fixture()
-def sample_docx(tmp_path) -> Path:
-    """Create a minimal .docx file for upload tests."""
+@pytest.fixture(scope="session")
+def sample_docx(tmp_path_factory) -> Path:
+    """Create a minimal .docx file for upload tests.
+
+    Session-scoped: tests only open the file for reading.  A test that needs
+    to modify it should copy it into its own ``tmp_path`` first.
+    """
     doc = Document()
     doc.add_paragraph("This agreement is between Acme Corporation and BigCo LLC.")
     doc.add_paragraph("Acme Corporation shall provide services to BigCo LLC.")
-    path = tmp_path / "test.docx"
+    path = tmp_path_factory.mktemp("api") / "test.docx"
     doc.save(str(path))
     return path
 
 
+@pytest.fixture(scope="module")
+def cloaked_session(client, sample_docx) -> str:
+    """Upload and cloak ``sample_docx`` once; return the session ID.
+
+    Shared by the read-only download tests, which never modify the session.
+    """
+    session_id = _upload(client, sample_docx)["session_id"]
+    resp = client.post("/api/cloak", data={
+        "session_id": session_id,
+        "party_a": "Acme Corporation",
+        "party_b": "BigCo LLC",
+    })
+    assert resp.status_code == 200
+    return session_id
+
+
 # ---------------------------------------------------------------------------
 # Upload
 # ---------------------------------------------------------------------------
 
 
 def test_upload_success(client, sample_docx):
-    with open(sample_docx, "rb") as f:
-        resp = client.post("/api/upload", files={"file": ("test.docx", f)})
-    assert resp.status_code == 200
-    data = _parse_upload_ndjson(resp)
+    data = _upload(client, sample_docx)
     assert "session_id" in data
     assert data["filename"] == "test.docx"
 
@@ -85,9 +121,7 @@ def test_upload_rejects_missing_filename(client):
 
 def test_cloak_success(client, sample_docx):
     # Upload first
-    with open(sample_docx, "rb") as f:
-        upload_resp = client.post("/api/upload", files={"file": ("test.docx", f)})
-    session_id = _parse_upload_ndjson(upload_resp)["session_id"]
+    session_id = _upload(client, sample_docx)["session_id"]
 
     # Cloak
     resp = client.post("/api/cloak", data={
@@ -116,9 +150,7 @@ def test_cloak_invalid_session(client):
 
 
 def test_cloak_invalid_comment_mode(client, sample_docx):
-    with open(sample_docx, "rb") as f:
-        upload_resp = client.post("/api/upload", files={"file": ("test.docx", f)})
-    session_id = _parse_upload_ndjson(upload_resp)["session_id"]
+    session_id = _upload(client, sample_docx)["session_id"]
 
     resp = client.post("/api/cloak", data={
         "session_id": session_id,
@@ -135,52 +167,26 @@ def test_cloak_invalid_comment_mode(client, sample_docx):
 # ---------------------------------------------------------------------------
 
 
-def test_download_cloaked(client, sample_docx):
-    # Upload + cloak
-    with open(sample_docx, "rb") as f:
-        upload_resp = client.post("/api/upload", files={"file": ("test.docx", f)})
-    session_id = _parse_upload_ndjson(upload_resp)["session_id"]
-    client.post("/api/cloak", data={
-        "session_id": session_id,
-        "party_a": "Acme Corporation",
-        "party_b": "BigCo LLC",
-    })
-
-    # Download cloaked
-    resp = client.get(f"/api/download/{session_id}/cloaked")
+def test_download_cloaked(client, cloaked_session):
+    resp = client.get(f"/api/download/{cloaked_session}/cloaked")
     assert resp.status_code == 200
     assert "application/vnd.openxmlformats" in resp.headers["content-type"]
 
 
-def test_download_mapping(client, sample_docx):
-    with open(sample_docx, "rb") as f:
-        upload_resp = client.post("/api/upload", files={"file": ("test.docx", f)})
-    session_id = _parse_upload_ndjson(upload_resp)["session_id"]
-    client.post("/api/cloak", data={
-        "session_id": session_id,
-        "party_a": "Acme Corporation",
-        "party_b": "BigCo LLC",
-    })
-
-    resp = client.get(f"/api/download/{session_id}/mapping")
+def test_download_mapping(client, cloaked_session):
+    resp = client.get(f"/api/download/{cloaked_session}/mapping")
     assert resp.status_code == 200
-    mapping = json.loads(resp.content)
+    mapping = _json_loads(resp.content)
     assert "mappings" in mapping
 
 
-def test_download_invalid_file_type(client, sample_docx):
-    with open(sample_docx, "rb") as f:
-        upload_resp = client.post("/api/upload", files={"file": ("test.docx", f)})
-    session_id = _parse_upload_ndjson(upload_resp)["session_id"]
-
-    resp = client.get(f"/api/download/{session_id}/invalid")
+def test_download_invalid_file_type(client, cloaked_session):
+    resp = client.get(f"/api/download/{cloaked_session}/invalid")
     assert resp.status_code == 400
 
 
 def test_download_before_cloak(client, sample_docx):
-    with open(sample_docx, "rb") as f:
-        upload_resp = client.post("/api/upload", files={"file": ("test.docx", f)})
-    session_id = _parse_upload_ndjson(upload_resp)["session_id"]
+    session_id = _upload(client, sample_docx)["session_id"]
 
     resp = client.get(f"/api/download/{session_id}/cloaked")
     assert resp.status_code == 404
@@ -193,9 +199,7 @@ def test_download_before_cloak(client, sample_docx):
 
 def test_uncloak_roundtrip(client, sample_docx):
     # Upload + cloak
-    with open(sample_docx, "rb") as f:
-        upload_resp = client.post("/api/upload", files={"file": ("test.docx", f)})
-    session_id = _parse_upload_ndjson(upload_resp)["session_id"]
+    session_id = _upload(client, sample_docx)["session_id"]
     cloak_resp = client.post("/api/cloak", data={
         "session_id": session_id,
         "party_a": "Acme Corporation",
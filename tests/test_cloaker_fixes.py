@@ -14,6 +14,7 @@ from docx import Document
 
 from clientcloak.cloaker import (
     _build_mappings_and_replacements,
+    _expand_company_name_parts,
     _expand_person_name_parts,
     _split_multiline_replacements,
     build_cloak_replacements,
@@ -275,6 +276,15 @@ class TestExpandPersonNameParts:
 
         assert result["Woods"] == "[Person-1]"
 
+    def test_all_caps_variant_shared_with_another_candidate(self):
+        """A candidate whose ALL-CAPS form is itself a candidate still matches."""
+        replacements = {"DARREN Bo-Yi Woods Darren": "[Person-1]"}
+        text = "Signed by DARREN today."
+        result = _expand_person_name_parts(replacements, text)
+
+        assert result["DARREN"] == "[Person-1]"
+        assert result["Darren"] == "[Person-1]"
+
     def test_lowercase_not_matched(self):
         """Lowercase 'woods' should NOT match (prevents false positives)."""
         replacements = {"Darren L. Woods": "[Person-1]"}
@@ -296,6 +306,15 @@ class TestExpandPersonNameParts:
         # "Theresa" should still be added if present
         assert result["Theresa"] == "[Person-1]"
 
+    def test_all_month_names_excluded(self):
+        """Every month name is a stopword, not just the common first names."""
+        replacements = {"January Jones": "[Person-1]"}
+        text = "January Jones signed on January 3rd. Jones agreed."
+        result = _expand_person_name_parts(replacements, text)
+
+        assert "January" not in result
+        assert result["Jones"] == "[Person-1]"
+
     def test_short_candidates_excluded(self):
         """Candidates < 3 chars (like 'Li') should be excluded."""
         replacements = {"Li Wei Chen": "[Person-1]"}
@@ -357,6 +376,28 @@ class TestExpandPersonNameParts:
         assert "Darren Woods" not in result
 
 
+class TestExpandCompanyNameParts:
+    def test_shared_fragment_goes_to_first_company(self):
+        replacements = {
+            "Exxon Mobil Corporation": "[Company-1]",
+            "Mobil Oil Limited": "[Company-2]",
+        }
+        text = "Exxon Mobil and Mobil Oil agreed; Mobil pays. MOBIL is silent."
+        result = _expand_company_name_parts(replacements, text)
+
+        assert result["Exxon Mobil"] == "[Company-1]"
+        assert result["Mobil"] == "[Company-1]"
+        assert result["Mobil Oil"] == "[Company-2]"
+        assert "Corporation" not in result
+
+    def test_match_is_case_sensitive_and_whole_word(self):
+        replacements = {"Exxon Mobil Corporation": "[Company-1]"}
+        text = "EXXON and Exxonite are not matches."
+        result = _expand_company_name_parts(replacements, text)
+
+        assert result == replacements
+
+
 # ===========================================================================
 # Integration: all fixes working together
 # ===========================================================================
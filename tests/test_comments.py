@@ -9,15 +9,23 @@ import pytest
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
+from defusedxml import EntitiesForbidden
+
 from clientcloak.comments import (
     generate_initials,
     inspect_comments,
     process_comments,
     restore_comment_authors,
+    restore_comment_authors_bytes,
 )
 from clientcloak.models import CommentMode
 from tests.conftest import make_docx_with_comments
 
+_NS_W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_W_COMMENT = f"{{{_NS_W}}}comment"
+_W_AUTHOR = f"{{{_NS_W}}}author"
+_W_T = f"{{{_NS_W}}}t"
+
 
 # ===================================================================
 # Helpers
@@ -36,10 +44,9 @@ def _get_comment_authors_from_xml(docx_path: Path) -> list[str]:
     root = _read_comments_xml(docx_path)
     if root is None:
         return []
-    ns_w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
     return [
-        el.get(f"{{{ns_w}}}author", "")
-        for el in root.findall(f"{{{ns_w}}}comment")
+        el.get(_W_AUTHOR, "")
+        for el in root.findall(_W_COMMENT)
     ]
 
 
@@ -111,6 +118,20 @@ class TestInspectComments:
         assert comments[0].text == "Specific comment text here"
         assert comments[0].author == "Alice"
 
+    def test_inspect_rejects_entity_declarations(self, tmp_path):
+        path = tmp_path / "dtd.docx"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr(
+                "word/comments.xml",
+                '<?xml version="1.0"?>'
+                '<!DOCTYPE w:comments [<!ENTITY a "Alice">]>'
+                f'<w:comments xmlns:w="{_NS_W}">'
+                '<w:comment w:id="0" w:author="&a;"><w:p/></w:comment>'
+                "</w:comments>",
+            )
+        with pytest.raises(EntitiesForbidden):
+            inspect_comments(path)
+
 
 # ===================================================================
 # process_comments: KEEP mode
@@ -138,6 +159,23 @@ class TestProcessCommentsKeep:
         assert "Jane Smith" in authors
         assert "Bob Jones" in authors
 
+    def test_keep_copies_every_part_unchanged(self, tmp_path):
+        path = make_docx_with_comments(
+            tmp_path / "to_copy.docx",
+            "Agreement text.",
+            [{"author": "Jane Smith", "initials": "JS", "text": "Comment one"}],
+        )
+        output_path = tmp_path / "copied.docx"
+        process_comments(path, output_path, CommentMode.KEEP)
+
+        with zipfile.ZipFile(path) as zin, zipfile.ZipFile(output_path) as zout:
+            assert zout.testzip() is None
+            assert zout.namelist() == zin.namelist()
+            for src in zin.infolist():
+                dst = zout.getinfo(src.filename)
+                assert dst.CRC == src.CRC
+                assert zout.read(dst) == zin.read(src)
+
 
 # ===================================================================
 # process_comments: STRIP mode
@@ -162,9 +200,8 @@ class TestProcessCommentsStrip:
 
         # Verify comments are gone
         root = _read_comments_xml(output_path)
-        ns_w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         if root is not None:
-            comments = root.findall(f"{{{ns_w}}}comment")
+            comments = root.findall(_W_COMMENT)
             assert len(comments) == 0
 
 
@@ -242,8 +279,7 @@ class TestProcessCommentsSanitize:
 
         # Verify content replacement in comments XML
         root = _read_comments_xml(output_path)
-        ns_w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-        for t_el in root.iter(f"{{{ns_w}}}t"):
+        for t_el in root.iter(_W_T):
             if t_el.text:
                 assert "Acme Corp" not in t_el.text
 
@@ -269,8 +305,7 @@ class TestProcessCommentsSanitize:
         )
 
         root = _read_comments_xml(output_path)
-        ns_w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-        texts = [t.text for t in root.iter(f"{{{ns_w}}}t") if t.text]
+        texts = [t.text for t in root.iter(_W_T) if t.text]
         full_text = " ".join(texts)
         assert "ACME" not in full_text.upper() or "[VENDOR]" in full_text
 
@@ -299,8 +334,7 @@ class TestProcessCommentsSanitize:
         )
 
         root = _read_comments_xml(output_path)
-        ns_w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-        texts = [t.text for t in root.iter(f"{{{ns_w}}}t") if t.text]
+        texts = [t.text for t in root.iter(_W_T) if t.text]
         full_text = " ".join(texts)
         assert "[VENDOR]" in full_text
         # Should not have matched the shorter variant
@@ -353,3 +387,26 @@ class TestRestoreCommentAuthors:
         # (it returns early without creating output)
         restore_comment_authors(path, tmp_path / "output.docx", {})
         assert not (tmp_path / "output.docx").exists()
+
+    def test_restore_bytes_matches_path_variant(self, tmp_path):
+        path = make_docx_with_comments(
+            tmp_path / "original.docx",
+            "Text.",
+            [{"author": "Jane Smith", "initials": "JS", "text": "Comment"}],
+        )
+        sanitized_path = tmp_path / "sanitized.docx"
+        mapping = process_comments(path, sanitized_path, CommentMode.SANITIZE)
+        reverse_mapping = {label: original for original, label in mapping.items()}
+
+        path_restored = tmp_path / "path_restored.docx"
+        restore_comment_authors(sanitized_path, path_restored, reverse_mapping)
+
+        bytes_restored = tmp_path / "bytes_restored.docx"
+        bytes_restored.write_bytes(
+            restore_comment_authors_bytes(sanitized_path.read_bytes(), reverse_mapping)
+        )
+        assert _get_comment_authors_from_xml(bytes_restored) == ["Jane Smith"]
+        assert (
+            _get_comment_authors_from_xml(bytes_restored)
+            == _get_comment_authors_from_xml(path_restored)
+        )
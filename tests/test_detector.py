@@ -6,11 +6,16 @@ filtering, placeholder generation, the unified detect_entities() entry point,
 and party name detection from legal preambles.
 """
 
+import re
+import threading
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock
 
 from clientcloak.detector import (
     detect_entities,
+    detect_entities_batch,
     detect_entities_regex,
     detect_party_names,
     deduplicate_entities,
@@ -19,6 +24,7 @@ from clientcloak.detector import (
     _run_gliner,
     _reassign_placeholders,
     _filter_gliner_entity,
+    _trie_alternation,
     _GLINER_LABEL_MAP,
 )
 from clientcloak.models import DetectedEntity
@@ -259,6 +265,25 @@ class TestDeduplication:
     def test_empty_input(self):
         assert deduplicate_entities([]) == []
 
+    def test_does_not_mutate_inputs(self):
+        first = DetectedEntity(
+            text="555-1234", entity_type="PHONE", confidence=0.8, count=1, suggested_placeholder="[Phone-1]",
+        )
+        entities = [
+            first,
+            DetectedEntity(
+                text="555-1234", entity_type="PHONE", confidence=0.9, count=2, suggested_placeholder="[Phone-1]",
+            ),
+            DetectedEntity(
+                text="555-1234", entity_type="PHONE", confidence=0.7, count=4, suggested_placeholder="[Phone-1]",
+            ),
+        ]
+        result = deduplicate_entities(entities)
+        assert result[0].count == 7
+        assert result[0].confidence == 0.9
+        assert first.count == 1
+        assert first.confidence == 0.8
+
 
 # ===================================================================
 # Party name filtering
@@ -278,6 +303,12 @@ class TestPartyNameFiltering:
         emails = [e for e in result if e.entity_type == "EMAIL"]
         assert len(emails) == 0
 
+    def test_filter_uses_casefold(self):
+        text = "Email: strasse@example.de for details."
+        result = detect_entities(text, party_names=["STRAßE@example.de"])
+        emails = [e for e in result if e.entity_type == "EMAIL"]
+        assert len(emails) == 0
+
     def test_no_filter_when_none(self):
         text = "Contact john@example.com"
         result = detect_entities(text, party_names=None)
@@ -316,6 +347,23 @@ class TestDetectEntities:
     def test_no_matches_returns_empty(self):
         assert detect_entities("This is a plain sentence with no PII.") == []
 
+    def test_repeated_regex_scans_return_independent_copies(self):
+        text = "Contact john@example.com for details."
+        first = detect_entities_regex(text)
+        first[0].count = 99
+        second = detect_entities_regex(text)
+        assert second[0].count == 1
+        assert second[0] is not first[0]
+
+    def test_top_k_matches_head_of_full_result(self):
+        text = (
+            "Call 555-123-4567 or 555-123-4567. Email john@example.com or "
+            "jane@example.com, jane@example.com. Pay $500 and $500 and $500."
+        )
+        full = detect_entities(text, use_gliner=False)
+        top = detect_entities(text, use_gliner=False, top_k=2)
+        assert top == full[:2]
+
     def test_sorted_by_count_descending(self):
         text = "Call 555-123-4567 or 555-123-4567. Email john@example.com."
         result = detect_entities(text)
@@ -392,6 +440,14 @@ class TestDetectPartyNames:
         assert result[1]["name"] == "BigCo LLC"
         assert result[1]["label"] == "Client"
 
+    def test_repeated_calls_return_independent_copies(self):
+        text = 'This Agreement is entered into by Making Reign Inc. (the "Company").'
+        first = detect_party_names(text)
+        first[0]["label"] = "Changed"
+        first.clear()
+        second = detect_party_names(text)
+        assert second == [{"name": "Making Reign Inc.", "label": "Company"}]
+
     def test_defined_term_with_curly_quotes(self):
         text = "This Agreement is entered into by Acme Corporation (\u201cLicensor\u201d)."
         result = detect_party_names(text)
@@ -655,6 +711,30 @@ class TestRunGliner:
         john_entities = [e for e in result if e.text == "John Smith"]
         assert len(john_entities) == 1
 
+    @patch("clientcloak.detector._get_gliner_model")
+    def test_batching_model_gets_all_chunks_at_once(self, mock_get_model, monkeypatch):
+        mock_model = MagicMock()
+        mock_model.batch_predict_entities.side_effect = lambda texts, *a, **kw: [
+            [{"text": "John Smith", "label": "person", "score": 0.95}] for _ in texts
+        ]
+        mock_get_model.return_value = mock_model
+        monkeypatch.setattr("clientcloak.detector._gliner_model_batches", True)
+
+        words = ["word"] * 400
+        words[10] = "John"
+        words[11] = "Smith"
+        result = _run_gliner(" ".join(words))
+
+        mock_model.batch_predict_entities.assert_called_once()
+        assert len(mock_model.batch_predict_entities.call_args[0][0]) > 1
+        mock_model.predict_entities.assert_not_called()
+        assert [e.text for e in result] == ["John Smith"]
+
+    @patch("clientcloak.detector._get_gliner_model")
+    def test_blank_text_does_not_load_model(self, mock_get_model):
+        assert _run_gliner("   \n") == []
+        mock_get_model.assert_not_called()
+
     @patch("clientcloak.detector._get_gliner_model")
     def test_returns_empty_when_unavailable(self, mock_get_model):
         mock_get_model.return_value = None
@@ -662,6 +742,51 @@ class TestRunGliner:
         assert result == []
 
 
+# ===================================================================
+# GLiNER model loading
+# ===================================================================
+
+class TestGetGlinerModel:
+
+    @pytest.fixture(autouse=True)
+    def _reset_model_state(self, monkeypatch):
+        monkeypatch.setattr("clientcloak.detector._gliner_model", None)
+        monkeypatch.setattr("clientcloak.detector._gliner_import_failed", False)
+
+    def test_concurrent_callers_load_once(self, monkeypatch):
+        import clientcloak.detector as det
+
+        loads = []
+
+        def fake_load(model_name):
+            loads.append(model_name)
+            time.sleep(0.05)
+            det._gliner_model = MagicMock()
+            return det._gliner_model
+
+        monkeypatch.setattr(det, "_load_gliner_model", fake_load)
+        threads = [threading.Thread(target=det._get_gliner_model) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(loads) == 1
+
+    def test_preload_loads_in_background(self, monkeypatch):
+        import clientcloak.detector as det
+
+        model = MagicMock()
+
+        def fake_load(model_name):
+            det._gliner_model = model
+            return model
+
+        monkeypatch.setattr(det, "_load_gliner_model", fake_load)
+        det.preload_gliner_model().join(timeout=5)
+        assert det._get_gliner_model() is model
+
+
 # ===================================================================
 # Placeholder reassignment
 # ===================================================================
@@ -691,6 +816,43 @@ class TestReassignPlaceholders:
         assert email_placeholders == ["[Email-1]", "[Email-2]"]
         assert phones[0].suggested_placeholder == "[Phone-1]"
 
+    def test_does_not_mutate_inputs(self):
+        stale = DetectedEntity(
+            text="john@a.com", entity_type="EMAIL", confidence=1.0, count=1, suggested_placeholder="[Email-7]",
+        )
+        result = _reassign_placeholders([stale])
+        assert result[0].suggested_placeholder == "[Email-1]"
+        assert stale.suggested_placeholder == "[Email-7]"
+
+
+# ===================================================================
+# detect_entities_batch()
+# ===================================================================
+
+class TestDetectEntitiesBatch:
+
+    TEXTS = [
+        "Contact john@example.com for details.",
+        "",
+        "Send $500 to jane@example.com.",
+    ]
+
+    def test_matches_single_document_results(self):
+        result = detect_entities_batch(self.TEXTS, use_gliner=False, max_workers=2)
+        assert result == [detect_entities(t, use_gliner=False) for t in self.TEXTS]
+
+    def test_single_worker_runs_inline(self):
+        with patch("concurrent.futures.ProcessPoolExecutor") as mock_pool:
+            result = detect_entities_batch(self.TEXTS, use_gliner=False, max_workers=1)
+        mock_pool.assert_not_called()
+        assert [e.text for e in result[0]] == ["john@example.com"]
+
+    def test_party_names_applied_to_every_document(self):
+        result = detect_entities_batch(
+            self.TEXTS, party_names=["jane@example.com"], use_gliner=False, max_workers=1,
+        )
+        assert all(e.text != "jane@example.com" for doc in result for e in doc)
+
 
 # ===================================================================
 # detect_entities() with GLiNER integration
@@ -723,6 +885,11 @@ class TestDetectEntitiesWithGliner:
         types = {e.entity_type for e in result}
         assert "EMAIL" in types
 
+    @patch("clientcloak.detector._run_gliner")
+    def test_blank_text_skips_gliner(self, mock_run_gliner):
+        assert detect_entities("  \n\t ", use_gliner=True) == []
+        mock_run_gliner.assert_not_called()
+
     @patch("clientcloak.detector._run_gliner")
     def test_gliner_failure_falls_back_to_regex(self, mock_run_gliner):
         mock_run_gliner.side_effect = RuntimeError("Model failed")
@@ -996,6 +1163,16 @@ class TestCityStatePattern:
         assert len(seattle) == 1
         assert seattle[0].count == 2
 
+    def test_trie_alternation_matches_exactly_the_words(self):
+        words = ["North Carolina", "North Dakota", "NC", "New", "New York"]
+        pattern = re.compile(_trie_alternation(words))
+        for word in words:
+            assert pattern.fullmatch(word)
+        assert not pattern.fullmatch("North")
+        assert not pattern.fullmatch("Nor")
+        # The longer of two prefix-related words is preferred.
+        assert pattern.match("New York").group() == "New York"
+
 
 # ===================================================================
 # Context-aware bare amount detection (no $ prefix)
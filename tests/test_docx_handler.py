@@ -14,13 +14,16 @@ from docx import Document
 from docx.shared import Pt
 from pathlib import Path
 
+from clientcloak import literal_search
 from clientcloak.docx_handler import (
     DocumentLoadError,
     PasswordProtectedError,
     UnsupportedFormatError,
     _is_bracketed_label,
     _transfer_case,
+    compile_replacements,
     extract_all_text,
+    iter_all_text,
     load_document,
     replace_text_in_document,
     replace_text_in_xml,
@@ -171,6 +174,12 @@ class TestExtractAllText:
         assert "Header text" in text_strings
         assert "Footer text" in text_strings
 
+    def test_iter_all_text_matches_extract(self, table_docx):
+        doc = load_document(table_docx)
+        lazy = iter_all_text(doc)
+        assert not isinstance(lazy, list)
+        assert [t for t, _ in lazy] == [t for t, _ in extract_all_text(doc)]
+
 
 # ===================================================================
 # replace_text_in_document
@@ -271,6 +280,38 @@ class TestReplaceTextInDocument:
         count = replace_text_in_document(doc, {"Acme": "[VENDOR]"})
         assert count >= 3
 
+    def test_precompiled_matcher_is_reused(self, tmp_path):
+        """A matcher from compile_replacements can be shared across passes."""
+        path = make_simple_docx(tmp_path / "shared.docx", ["Acme Corporation pays Acme."])
+        replacements = {"Acme Corporation": "[Company-1]", "Acme": "[Company-2]"}
+        compiled = compile_replacements(replacements)
+
+        doc = load_document(path)
+        count = replace_text_in_document(doc, replacements, compiled=compiled)
+        assert count == 2
+        assert doc.paragraphs[0].text == "[Company-1] pays [Company-2]."
+
+        doc.save(str(path))
+        assert replace_text_in_xml(path, replacements, compiled=compiled) == 0
+
+    def test_regex_backend_matches_automaton(self, tmp_path, monkeypatch):
+        """Without pyahocorasick the same replacements are made."""
+        path = make_simple_docx(
+            tmp_path / "backends.docx",
+            ["ACME Corporation and Acme both work with BigCo LLC.", "acme corp"],
+        )
+        replacements = {"Acme Corporation": "Vendor", "Acme": "[SHORT]",
+                        "BigCo LLC": "Customer"}
+
+        def _run() -> list[str]:
+            doc = load_document(path)
+            replace_text_in_document(doc, replacements)
+            return [p.text for p in doc.paragraphs]
+
+        default = _run()
+        monkeypatch.setattr(literal_search, "ahocorasick", None)
+        assert _run() == default
+
 
 # ===================================================================
 # _transfer_case
@@ -375,6 +416,20 @@ class TestCrossRunReplacement:
         full = "".join(r.text for r in doc.paragraphs[0].runs)
         assert "BigCo LLC" in full
 
+    def test_empty_runs_between_split_text(self, tmp_path):
+        """Empty runs around a split match must not shift the run lookup."""
+        doc = Document()
+        p = doc.add_paragraph()
+        for text in ("", "Acme", "", " Corporation", "", " and Acme."):
+            p.add_run(text)
+
+        count = replace_text_in_document(doc, {"Acme Corporation": "[VENDOR]",
+                                               "Acme": "[SHORT]"})
+        assert count == 2
+        assert [r.text for r in p.runs] == [
+            "", "[VENDOR]", "", "", "", " and [SHORT].",
+        ]
+
 
 # ===================================================================
 # Bracketed label preservation
@@ -587,3 +642,31 @@ class TestReplaceTextInXml:
         with zipfile.ZipFile(path, "r") as zf:
             xml = zf.read("word/document.xml").decode("utf-8")
         assert "x &lt; y &amp; a &gt; b" in xml
+
+    def test_unmatched_parts_are_left_byte_identical(self, tmp_path):
+        """Parts and <w:t> elements without a match are not re-serialized."""
+        import zipfile
+        path = make_docx_with_tracked_insertion(
+            tmp_path / "untouched.docx",
+            "Acme signed.",
+            "Body text.",
+        )
+        with zipfile.ZipFile(path, "r") as zf:
+            xml = zf.read("word/document.xml").decode("utf-8")
+        # Character references that a naive unescape/escape would rewrite.
+        xml = xml.replace("Body text.", "&#8220;Body&#8221; &quot;text&quot;.")
+        rebuilt = tmp_path / "rebuilt.docx"
+        with zipfile.ZipFile(path, "r") as zin, \
+             zipfile.ZipFile(rebuilt, "w", zipfile.ZIP_DEFLATED) as zout:
+            for item in zin.infolist():
+                data = zin.read(item.filename)
+                if item.filename == "word/document.xml":
+                    data = xml.encode("utf-8")
+                zout.writestr(item, data)
+
+        count = replace_text_in_xml(rebuilt, {"Acme": "[Vendor]"})
+        assert count == 1
+
+        with zipfile.ZipFile(rebuilt, "r") as zf:
+            out = zf.read("word/document.xml").decode("utf-8")
+        assert out == xml.replace("Acme", "[Vendor]")
@@ -0,0 +1,73 @@
+"""
+Tests for clientcloak.literal_search: the multi-literal matcher shared by the
+replacement passes.
+
+The Aho-Corasick backend must behave exactly like the alternation-regex
+fallback (case-insensitive, leftmost-longest, non-overlapping).
+"""
+
+import re
+
+import pytest
+
+from clientcloak import literal_search
+from clientcloak.literal_search import compile_literals
+
+
+@pytest.fixture(params=["regex", "ahocorasick"])
+def backend(request, monkeypatch):
+    """Run each test against both backends."""
+    if request.param == "regex":
+        monkeypatch.setattr(literal_search, "ahocorasick", None)
+    else:
+        pytest.importorskip("ahocorasick")
+    return request.param
+
+
+def _spans(pattern, text):
+    return [(m.start(), m.end(), m.group()) for m in pattern.finditer(text)]
+
+
+def test_regex_backend_when_ahocorasick_missing(monkeypatch):
+    monkeypatch.setattr(literal_search, "ahocorasick", None)
+    assert isinstance(compile_literals(["Acme"]), re.Pattern)
+
+
+def test_longest_match_wins(backend):
+    pattern = compile_literals(["Acme", "Acme Corporation"])
+    assert _spans(pattern, "Acme Corporation and Acme") == [
+        (0, 16, "Acme Corporation"),
+        (21, 25, "Acme"),
+    ]
+
+
+def test_case_insensitive(backend):
+    pattern = compile_literals(["BigCo LLC"])
+    assert _spans(pattern, "BIGCO LLC / bigco llc") == [
+        (0, 9, "BIGCO LLC"),
+        (12, 21, "bigco llc"),
+    ]
+
+
+def test_overlapping_targets_leftmost_first(backend):
+    pattern = compile_literals(["abc", "bcde"])
+    assert _spans(pattern, "abcde") == [(0, 3, "abc")]
+
+
+def test_sub_and_search(backend):
+    pattern = compile_literals(["Acme", "Jane Smith"])
+    lookup = {"acme": "[Vendor]", "jane smith": "[Person-1]"}
+    text = "ACME hired Jane Smith."
+    assert pattern.sub(lambda m: lookup[m.group().lower()], text) == "[Vendor] hired [Person-1]."
+    assert pattern.search("nothing here") is None
+    assert pattern.search(text).group() == "ACME"
+
+
+def test_matches_regex_backend(monkeypatch):
+    pytest.importorskip("ahocorasick")
+    targets = ["Acme", "Acme Corp", "Corp", "Smith & Co", "[Vendor]", "ä-GmbH"]
+    text = "ACME CORP met Smith & Co and [vendor] of Ä-GmbH; acme corporation."
+    fast = compile_literals(targets)
+    monkeypatch.setattr(literal_search, "ahocorasick", None)
+    slow = compile_literals(targets)
+    assert _spans(fast, text) == _spans(slow, text)
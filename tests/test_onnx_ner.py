@@ -332,6 +332,34 @@ class TestOnnxNerModelPredictEntities:
         # Verify tokenizer was called (model ran without error)
         assert session.run.called
 
+    def test_batch_runs_session_once(self):
+        logits = np.zeros((2, 2, 12, 1), dtype=np.float32)
+        logits[0, 0, 1, 0] = 3.0  # "John Smith" in the first text
+        logits[1, 1, 0, 0] = 3.0  # "Doe" in the second text
+        model, session = self._make_model(logits)
+
+        results = model.batch_predict_entities(
+            ["John Smith", "", "Jane Doe"], ["person"], threshold=0.5,
+        )
+
+        assert session.run.call_count == 1
+        feed = session.run.call_args[0][1]
+        assert feed["input_ids"].shape[0] == 2
+        assert [e["text"] for e in results[0]] == ["John Smith"]
+        assert results[1] == []
+        assert [e["text"] for e in results[2]] == ["Doe"]
+
+    def test_fixed_batch_axis_runs_one_text_at_a_time(self):
+        logits = np.zeros((1, 2, 12, 1), dtype=np.float32)
+        model, session = self._make_model(logits)
+        session.get_inputs.return_value[0].shape = [1, "sequence"]
+        model = OnnxNerModel(session, model._tokenizer, max_width=12, max_len=384)
+
+        results = model.batch_predict_entities(["John Smith", "Jane Doe"], ["person"])
+
+        assert session.run.call_count == 2
+        assert results == [[], []]
+
 
 # ===================================================================
 # Integration: load_onnx_model (file I/O mocked)
@@ -347,6 +347,28 @@ class TestFilenameSanitization:
         result = sanitize_filename("Acme_Corporation_contract", replacements)
         assert result == "[Full Vendor]_contract"
 
+    def test_sanitize_filename_overlapping_names_longest_wins(self):
+        """When two names overlap, the longer one is replaced even if it starts later."""
+        replacements = {
+            "Big Acme": "[Customer]",
+            "Acme Holdings Group": "[Vendor]",
+        }
+        result = sanitize_filename("Big_Acme_Holdings_Group_NDA", replacements)
+        assert result == "Big_[Vendor]_NDA"
+
+    def test_sanitize_filename_suffix_stripped_variant(self):
+        """A name is matched without its corporate suffix."""
+        replacements = {"Making Reign Inc.": "[Vendor]"}
+        assert sanitize_filename("Making_Reign_NDA", replacements) == "[Vendor]_NDA"
+        assert sanitize_filename("Making_Reign_Inc._NDA", replacements) == "[Vendor]_NDA"
+
+    def test_sanitize_filename_camel_case(self):
+        """Spaces in a name also match CamelCase, hyphens, and dots."""
+        replacements = {"Making Reign Inc.": "[Vendor]", "Acme Corp": "[Customer]"}
+        assert sanitize_filename("MakingReign_NDA", replacements) == "[Vendor]_NDA"
+        assert sanitize_filename("Acme-Corp.NDA", replacements) == "[Customer].NDA"
+        assert sanitize_filename("AcmeCorpMSA", replacements) == "[Customer]MSA"
+
     def test_sanitize_filename_for_config(self):
         """The config-based convenience wrapper works correctly."""
         config = CloakConfig(